@@ -0,0 +1,50 @@
+"""
+python_json_utils.py
+v1.0.0xg  2026/10/15  XdG / MIS Center
+----------------------------------------------
+Overview:
+This module provides the JSON output helper shared by the Python system tools
+(`python_pkg_info.py`, `python_pkg_upgrader.py` and `python_sysdiags.py`), so that they all
+serialize their JSON and NDJSON output the same way.
+
+Core Design Principles:
+1. Lazy Loading: The tools only import this module once JSON output is requested, so that
+   text output never pays for `json` or `orjson`.
+2. Optional Acceleration: The optional 'orjson' library serializes straight to bytes, several
+   times faster than the standard `json` module, which is used when it is not installed.
+3. Stable Layout: The standard `json` fallback keeps each tool's historical layout (its own
+   indent, ASCII escapes), so that a non-UTF-8 stdout cannot fail part-way through a document.
+"""
+
+import json
+import sys
+
+# orjson only supports a two-space indent and always writes non-ASCII characters as UTF-8.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def print_json(data, indent: int = 4):
+    """
+    Prints data to stdout as one JSON document followed by a newline, and flushes it.
+
+    With orjson, an indented document always uses two spaces. The standard `json` fallback
+    uses `indent`. With `indent=None`, both write a single compact line (NDJSON) with the
+    same separators.
+
+    Args:
+        data: The JSON-serializable object to print.
+        indent (int): The indent of the `json` fallback, or None for a compact line.
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE  # pylint: disable=no-member
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2  # pylint: disable=no-member
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=option))  # pylint: disable=no-member
+        sys.stdout.buffer.flush()
+    else:
+        separators = None if indent is not None else (",", ":")
+        sys.stdout.write(json.dumps(data, indent=indent, separators=separators) + "\n")
+        sys.stdout.flush()
@@ -26,75 +26,195 @@ Core Functionality:
 """
 
 import argparse
+import contextlib
+import errno
+import functools
+import logging
+import os
 import sys
-import json
-from python_pkg_utils import resolve_package_metadata, set_debug_mode
+import tempfile
+
+# The fields emitted in non-verbose JSON output, in display order.
+STANDARD_KEYS = ("package_name", "import_name", "exact_path",
+                 "current_version", "latest_version", "module_type")
 
 # --- Command-Line Entry Point (Handles Display) ---
 
-def display_results(metadata: dict, json_output: bool, quiet_mode: bool, verbose_mode: bool):
+def select_output_fields(metadata: dict, verbose_mode: bool) -> dict:
     """
-    Prints the structured metadata dictionary either as formatted text or JSON.
-
-    This function is responsible for the presentation layer. It takes the data
-    dictionary from `resolve_package_metadata` and formats it for the user based
-    on the specified command-line flags.
+    Selects the metadata fields to emit in JSON output.
 
     Args:
         metadata: The dictionary of package information.
-        json_output: If True, output in JSON format.
-        quiet_mode: If True, suppress headers in text output.
-        verbose_mode: If True, include extra details in text output.
+        verbose_mode: If True, keep every field; otherwise keep only the standard fields.
+
+    Returns:
+        The dictionary to serialize.
     """
-    # If the metadata dictionary contains an error, print it to stderr and exit.
-    if 'error' in metadata:
-        sys.stderr.write(f"ERROR: {metadata['error']}\n")
-        return
+    if verbose_mode:
+        return metadata
 
-    # Handle JSON output.
-    if json_output:
-        if not verbose_mode:
-            standard_keys = [
-                "package_name", "import_name", "exact_path",
-                "current_version", "latest_version", "module_type"
-            ]
-            output_data = {k: metadata[k] for k in standard_keys if k in metadata}
+    return {k: metadata[k] for k in STANDARD_KEYS if k in metadata}
+
+@contextlib.contextmanager
+def atomic_output(path: str):
+    """
+    Redirects standard output into a file that replaces `path` atomically on success.
+
+    The output is written to a temporary file in the same directory, which is renamed over
+    `path` only once everything has been written, so readers never see a partial file. On
+    failure, the temporary file is removed and `path` is left untouched.
+
+    Args:
+        path: The file to create or replace.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.",
+                                    suffix=".tmp")
+    try:
+        # mkstemp creates the file as 0600; give it the permissions of a normal new file.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp, contextlib.redirect_stdout(tmp):
+            yield
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def stream_ndjson(results: list, offline: bool, verbose_mode: bool):
+    """
+    Streams the results as NDJSON, one line per package, in request order (a repeated
+    package name is emitted together with its first occurrence).
+
+    Each line is written as soon as its PyPI lookup (and every lookup before it) completes,
+    so downstream tools can start processing before the whole batch is done.
+
+    Args:
+        results: The locally resolved metadata dictionaries, without latest versions.
+        offline: If True, skip the PyPI lookups.
+        verbose_mode: If True, keep every field; otherwise keep only the standard fields.
+    """
+    from python_json_utils import print_json  # pylint: disable=import-outside-toplevel
+    from python_pkg_utils import iter_latest_versions  # pylint: disable=import-outside-toplevel
+
+    found = []
+    for metadata in results:
+        if 'error' in metadata:
+            sys.stderr.write(f"ERROR: {metadata['error']}\n")
         else:
-            output_data = metadata
+            found.append(metadata)
 
-        print(json.dumps(output_data, indent=4))
+    if offline:
+        latest_versions = ((metadata['package_name'], "(offline)") for metadata in found)
     else:
-        # Handle human-readable text output.
+        latest_versions = iter_latest_versions(metadata['package_name'] for metadata in found)
 
-        if not quiet_mode:
-            print("\n--- Package Metadata ---")
+    for package_name, latest_version in latest_versions:
+        for metadata in found:
+            if metadata['package_name'] == package_name:
+                metadata['latest_version'] = latest_version
+                print_json(select_output_fields(metadata, verbose_mode), indent=None)
+
+def format_dependency_list(requirements: list) -> str:
+    """
+    Formats requirement strings as an indented block for the text report.
+
+    Args:
+        requirements: The requirement strings, as read from `Distribution.requires`.
+
+    Returns:
+        The indented block (starting with a newline), or "None" if the list is empty.
+    """
+    return "\n    " + "\n    ".join(requirements) if requirements else "None"
+
+def display_json(metadata: dict, verbose_mode: bool):
+    """
+    Prints the metadata dictionary of a package as a JSON document.
+
+    Args:
+        metadata: The dictionary of package information from `resolve_package_metadata`.
+        verbose_mode: If True, include every field; otherwise only the standard fields.
+    """
+    from python_json_utils import print_json  # pylint: disable=import-outside-toplevel
+
+    print_json(select_output_fields(metadata, verbose_mode))
+
+def display_text(metadata: dict, quiet_mode: bool, verbose_mode: bool):
+    """
+    Prints the metadata dictionary of a package as a human-readable report.
+
+    Args:
+        metadata: The dictionary of package information from `resolve_package_metadata`.
+        quiet_mode: If True, suppress headers and separators.
+        verbose_mode: If True, include dependency, licensing, and author details.
+    """
+    # Lines are collected and written in one call rather than through a dozen
+    # separate print() calls.
+    lines = []
+    if not quiet_mode:
+        lines.append("\n--- Package Metadata ---")
+
+    lines.append(f"Found Package:   {metadata['package_name']}")
+    lines.append(f"Import Name:     {metadata['import_name']}")
+    lines.append(f"Exact Path:      {metadata['exact_path']}")
+
+    if not quiet_mode:
+        lines.append("---")
 
-        print(f"Found Package:   {metadata['package_name']}")
-        print(f"Import Name:     {metadata['import_name']}")
-        print(f"Exact Path:      {metadata['exact_path']}")
+    lines.append(f"Current Version: {metadata['current_version']}")
+    lines.append(f"Latest Version:  {metadata['latest_version']}")
+    lines.append(f"Module Type:     {metadata['module_type']}")
 
+    if verbose_mode:
         if not quiet_mode:
-            print("---")
+            lines.append("\n--- Dependencies & Licensing ---")
 
-        print(f"Current Version: {metadata['current_version']}")
-        print(f"Latest Version:  {metadata['latest_version']}")
-        print(f"Module Type:     {metadata['module_type']}")
+        lines.append(f"Summary:         {metadata['metadata_summary']}")
+        lines.append(f"License:         {metadata['license']}")
+        lines.append(f"Author:          {metadata['author']}")
+        lines.append(f"Homepage URL:    {metadata['homepage']}")
+        lines.append(f"Python Requires: {metadata['required_python_version']}")
+        dependencies = format_dependency_list(metadata['required_dependencies'])
+        lines.append(f"Dependencies:    {dependencies}")
 
-        if verbose_mode:
-            if not quiet_mode:
-                print("\n--- Dependencies & Licensing ---")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-            def format_list(items):
-                items = [str(item) for item in items]
-                return "\n" + "    " + "\n    ".join(items) if items else "None"
 
-            print(f"Summary:         {metadata['metadata_summary']}")
-            print(f"License:         {metadata['license']}")
-            print(f"Author:          {metadata['author']}")
-            print(f"Homepage URL:    {metadata['homepage']}")
-            print(f"Python Requires: {metadata['required_python_version']}")
-            print(f"Dependencies:    {format_list(metadata['required_dependencies'])}")
+def display_all(results: list, json_output: bool, quiet_mode: bool, verbose_mode: bool):
+    """
+    Prints the results of all requested packages; errors are written to stderr.
+
+    Args:
+        results: The metadata dictionaries from `resolve_package_metadata`, in request order.
+        json_output: If True, output in JSON format (a JSON array for several packages).
+        quiet_mode: If True, suppress headers in text output.
+        verbose_mode: If True, include extra details in the output.
+    """
+    if json_output and len(results) > 1:
+        from python_json_utils import print_json  # pylint: disable=import-outside-toplevel
+
+        # Several packages are emitted as a single JSON array.
+        for metadata in results:
+            if 'error' in metadata:
+                sys.stderr.write(f"ERROR: {metadata['error']}\n")
+        print_json([select_output_fields(metadata, verbose_mode)
+                    for metadata in results if 'error' not in metadata])
+        return
+
+    # Pick the presentation once; each package then goes straight to its formatter.
+    if json_output:
+        display = functools.partial(display_json, verbose_mode=verbose_mode)
+    else:
+        display = functools.partial(display_text, quiet_mode=quiet_mode,
+                                    verbose_mode=verbose_mode)
 
+    for metadata in results:
+        if 'error' in metadata:
+            sys.stderr.write(f"ERROR: {metadata['error']}\n")
+        else:
+            display(metadata)
 
 def main():
     """
@@ -102,10 +222,17 @@ def main():
 
     This function is responsible for:
     1. Parsing command-line arguments.
-    2. Calling the core logic to resolve package metadata.
+    2. Calling the core logic to resolve local package metadata, then fetching the
+       latest PyPI versions for all requested packages concurrently.
     3. Passing the results to the display function for output.
     """
 
+    # A bare invocation only needs a usage hint, so answer it before building the parser.
+    if len(sys.argv) == 1:
+        sys.stderr.write(f"usage: {os.path.basename(sys.argv[0])} --package PACKAGE [PACKAGE ...] "
+                         "[options]\nRun with --help to list all options.\n")
+        sys.exit(1)
+
     # Set up the command-line argument parser.
     parser = argparse.ArgumentParser(
         description=("Locate the exact installation folder and retrieve metadata "
@@ -116,8 +243,9 @@ def main():
     parser.add_argument(
         '--package',
         type=str,
+        nargs='+',
         required=True,
-        help="The name of the package as listed by 'pip list'."
+        help="The name of one or more packages as listed by 'pip list'."
     )
 
     # Optional arguments for output control
@@ -126,6 +254,16 @@ def main():
         action='store_true',
         help='Output the results in JSON format.'
     )
+    parser.add_argument(
+        '--ndjson',
+        action='store_true',
+        help='Output one compact JSON object per line, streamed as each lookup completes.'
+    )
+    parser.add_argument(
+        '--output',
+        metavar='FILE',
+        help='Write the results to FILE (replaced atomically) instead of standard output.'
+    )
     parser.add_argument(
         '--quiet',
         action='store_true',
@@ -136,26 +274,87 @@ def main():
         action='store_true',
         help='Display detailed dependency, licensing, and author information.'
     )
+    parser.add_argument(
+        '--offline', '--no-latest',
+        dest='offline',
+        action='store_true',
+        help='Skip the PyPI latest-version lookup and report local metadata only.'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always query PyPI for the latest version, bypassing the on-disk cache.'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Revalidate every cached PyPI version with PyPI, regardless of its age.'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        metavar='SECONDS',
+        help='Maximum age of a cached PyPI version before it is revalidated '
+             '(default: PYPI_CACHE_TTL of python_pkg_utils, 3600).'
+    )
     parser.add_argument(
         '--debug',
         action='store_true',
         help='Display detailed path resolution debugging information.'
     )
 
-    if len(sys.argv) == 1:
-        parser.print_help(sys.stderr)
-        sys.exit(1)
-
     args = parser.parse_args()
 
-    # Set the global debug flag in the utility module
+    # The utility module (and `importlib.metadata` behind it) is imported only once the
+    # arguments are valid, so that --help and usage errors return without paying for it.
+    # It raises ImportError on unsupported Python versions; exit with its message.
+    try:
+        from python_pkg_utils import (  # pylint: disable=import-outside-toplevel
+            fetch_latest_versions, resolve_package_metadata, set_debug_mode, set_pypi_cache,
+            set_top_level_index)
+    except ImportError as e:
+        sys.exit(f"Error: {e}")
+
+    # Debug messages from the utility module are written to stderr, without log decorations.
+    logging.basicConfig(format="%(message)s")
     set_debug_mode(args.debug)
+    set_pypi_cache(enabled=not args.no_cache, ttl=0 if args.refresh else args.cache_ttl)
+    # A single lookup is faster with one `find_spec` than with an index of every distribution.
+    set_top_level_index(len(args.package) > 1)
+
+    if not args.quiet and not args.json and not args.ndjson:
+        print(f"Searching for: {', '.join(args.package)}")
 
-    if not args.quiet and not args.json:
-        print(f"Searching for: {args.package}")
+    # Resolve local metadata first (cheap), then look up all latest versions in one batch.
+    results = [resolve_package_metadata(name, fetch_latest=False) for name in args.package]
+
+    # Open the --output file up front so that an unwritable destination is reported as a
+    # usage error; a directory is rejected too, since the final rename would fail on it.
+    output = contextlib.ExitStack()
+    if args.output:
+        try:
+            if os.path.isdir(args.output):
+                raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR))
+            output.enter_context(atomic_output(args.output))
+        except OSError as e:
+            parser.error(f"cannot write --output file '{args.output}': {e.strerror}")
+
+    with output:
+        if args.ndjson:
+            stream_ndjson(results, args.offline, args.verbose)
+            return
+
+        found = [metadata for metadata in results if 'error' not in metadata]
+        if args.offline:
+            for metadata in found:
+                metadata['latest_version'] = "(offline)"
+        else:
+            latest_versions = fetch_latest_versions(
+                metadata['package_name'] for metadata in found)
+            for metadata in found:
+                metadata['latest_version'] = latest_versions[metadata['package_name']]
 
-    metadata = resolve_package_metadata(args.package)
-    display_results(metadata, args.json, args.quiet, args.verbose)
+        display_all(results, args.json, args.quiet, args.verbose)
 
 if __name__ == "__main__":
     main()
@@ -12,17 +12,125 @@ public API definition, and more.
 """
 
 import sys
-import argparse
-import inspect
-import warnings
+import functools
 import time
 from typing import List, Dict, Any
-import importlib.metadata
-import importlib.util
 import importlib
-import re
 import os
 
+# Status tags attached to each check result and outcome line, interned once and shared
+TAG_PASS = sys.intern("[PASS]")
+TAG_WARN = sys.intern("[WARN]")
+TAG_INFO = sys.intern("[INFO]")
+TAG_OK = sys.intern("[OK]")
+TAG_FAIL = sys.intern("[FAIL]")
+
+# Well-known license families reported by the license check, in match-priority order
+_LICENSE_KEYWORDS = ("MIT", "BSD", "APACHE", "GPL", "LGPL", "PUBLIC DOMAIN")
+
+# Characters allowed in the leading project name of a Requires-Dist entry
+_REQ_NAME_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._-")
+
+# File extensions identifying compiled extension modules (compared lower-cased)
+_C_EXTENSION_SUFFIXES = frozenset(('.so', '.pyd', '.dll', '.dylib'))
+
+# Maximum number of distinct import warnings kept; further ones are only counted
+_MAX_CAPTURED_WARNINGS = 100
+
+# Checks that can run from the import spec and distribution metadata alone (--static-only)
+_STATIC_CHECK_NUMBERS = frozenset((1, 2, 11, 12, 13))
+
+@functools.lru_cache(maxsize=None)
+def _get_metadata(name: str):
+    """
+    Returns the distribution metadata for a name, memoized per process.
+
+    Args:
+        name (str): The distribution (or module) name to look up.
+
+    Returns:
+        The PackageMetadata message, or None if no such distribution is installed.
+    """
+    from importlib import metadata  # pylint: disable=import-outside-toplevel
+    try:
+        return metadata.metadata(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+def _requirement_name(requirement: str) -> str:
+    """
+    Extracts the leading project name from a Requires-Dist entry.
+
+    Args:
+        requirement (str): A requirement string, e.g. "idna<4,>=2.5; extra == 'socks'".
+
+    Returns:
+        str: The project name ("idna"), or an empty string if the entry does not start
+            with one.
+    """
+    for index, char in enumerate(requirement):
+        if char not in _REQ_NAME_CHARS:
+            return requirement[:index]
+    return requirement
+
+def _has_annotations(obj: Any) -> bool:
+    """
+    Cheaply checks whether a function or class carries any type annotations.
+
+    Classes are judged by their __init__, which is what inspect.signature() reports.
+
+    Args:
+        obj (Any): The function or class to check.
+
+    Returns:
+        bool: True if at least one parameter or return annotation is present.
+    """
+    if isinstance(obj, type):
+        obj = getattr(obj, '__init__', None)
+    return bool(getattr(obj, '__annotations__', None))
+
+def _signature_has_annotations(obj: Any) -> bool:
+    """
+    Checks for type annotations using the full inspect.signature() introspection.
+
+    Slower than _has_annotations() but follows __wrapped__ chains and __new__/__signature__.
+
+    Args:
+        obj (Any): The function or class to check.
+
+    Returns:
+        bool: True if at least one parameter or return annotation is present.
+    """
+    import inspect  # pylint: disable=import-outside-toplevel
+    try:
+        signature = inspect.signature(obj)
+    except (ValueError, TypeError):
+        return False
+    if signature.return_annotation is not inspect.Signature.empty:
+        return True
+    return any(param.annotation is not inspect.Parameter.empty
+               for param in signature.parameters.values())
+
+def _dir_has_c_extension(directory: str) -> bool:
+    """
+    Checks whether a directory directly contains a compiled extension module.
+
+    Args:
+        directory (str): The directory to scan (not recursive).
+
+    Returns:
+        bool: True as soon as one extension file is found, False otherwise or if the
+            directory cannot be read.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() in _C_EXTENSION_SUFFIXES:
+                    return True
+    except OSError:
+        pass
+    return False
+
 def print_methodology_doc():
     """Prints the comprehensive documentation for the soundness checks and rating systems."""
     doc = r"""
@@ -76,6 +184,8 @@ I. GENERIC SOUNDNESS CHECKS (1-13)
 
 6.  **Object Definition Quality/Encapsulation**
     - **Purpose:**   Assesses the balance between public and private (underscore-prefixed) members.
+                     When `__all__` is a non-empty list it defines the public members used by
+                     checks 6, 7, 8 and 10; otherwise all non-underscore names are public.
     - **[PASS]:**    The ratio of private members is reasonable (<70%) or there are enough public members (>=5).
     - **[WARN]:**    The API may be poorly encapsulated, with a high private member ratio (>70%) and very few public members (<5).
     - **[INFO]:**    The module namespace is empty (contains no members to analyze).
@@ -91,15 +201,19 @@ I. GENERIC SOUNDNESS CHECKS (1-13)
     - **[INFO]:**    No top-level public functions or classes were found.
 
 9.  **Import Health (Warnings/Deprecations)**
-    - **Purpose:**   Captures any warnings (e.g., `DeprecationWarning`) that occur during import.
+    - **Purpose:**   Captures any warnings (e.g., `DeprecationWarning`) that occur during import,
+                     keeping one record per distinct category and message (at most 100;
+                     any further warnings are only counted).
     - **[PASS]:**    The module imported cleanly with no warnings.
     - **[WARN]:**    One or more unique warnings were detected during import.
 
 10. **Type Hint Coverage**
     - **Purpose:**   Measures the percentage of public functions/classes that have type annotations.
+                     Reads __annotations__ (a class's __init__) unless --accurate-type-hints is given,
+                     which uses full signature introspection instead.
     - **[PASS]:**    Excellent coverage (>= 75%).
     - **[WARN]:**    Moderate coverage (>= 30% but < 75%).
-    - **[INFO]:**    Low coverage (< 30%) or no callables to analyze.
+    - **[INFO]:**    Low coverage (< 30%), no callables to analyze, or a C-Extension module.
 
 11. **Distribution Metadata Status**
     - **Purpose:**   Checks if the module is part of a distributed package with metadata.
@@ -126,6 +240,8 @@ II. PERFORMANCE & ENVIRONMENT CHECKS
 - **[PASS]:**    Excellent performance (< 0.1 seconds).
 - **[INFO]:**    Acceptable performance (0.1 to 1.0 seconds).
 - **[WARN]:**    Slow performance (> 1.0 seconds), indicating a potential startup bottleneck.
+- **Note:**      Skipped with --static-only, which locates the module via its import spec
+                without executing it and runs only checks 1, 2 and 11-13.
 
 **Environment Check**
 - **Purpose:**   Reports key details about the Python interpreter running the check.
@@ -160,33 +276,37 @@ def print_report(results: List[Dict[str, Any]]):
             print(summary)
             if r.get('sub_details'):
                 for detail_line in r['sub_details']:
-                    parts = detail_line.split(':', 1)
-                    if len(parts) == 2:
-                        prefix = parts[0].strip().title().replace("Optional/Conditional",
-                                                                  "Optional")
-                        print(f"  - {prefix}: {parts[1].strip()}")
+                    prefix, sep, rest = detail_line.partition(':')
+                    if sep:
+                        prefix = prefix.strip().title().replace("Optional/Conditional",
+                                                                "Optional")
+                        print(f"  - {prefix}: {rest.strip()}")
         else:
             # General case for other checks with potential sub-details
             sub_details = r.get('sub_details')
             if sub_details:
-                combined_subs = "; ".join([s.strip() for s in sub_details if s.strip()])
+                combined_subs = "; ".join(s for s in (x.strip() for x in sub_details) if s)
                 if combined_subs:
                     summary += f" ({combined_subs})"
             print(summary)
 
-def print_performance_check(analysis: 'ModuleAnalysis'):
-    """Prints the import performance check results."""
+def print_performance_check(duration: float):
+    """
+    Prints the import performance check results.
+
+    Args:
+        duration (float): The measured import time, in seconds.
+    """
     print("\n--- Performance Check ---")
     excellent_perf_threshold = 0.1
-    duration = analysis.import_duration
 
     if duration < excellent_perf_threshold:
-        tag, status, output = ("[PASS]", "Excellent (Fast startup)",
+        tag, status, output = (TAG_PASS, "Excellent (Fast startup)",
                                f"{duration:.4f} s < {excellent_perf_threshold:.1f} s.")
     elif duration < 1.0:
-        tag, status, output = "[INFO]", "Acceptable", f"{duration:.4f} seconds."
+        tag, status, output = TAG_INFO, "Acceptable", f"{duration:.4f} seconds."
     else:
-        tag, status, output = ("[WARN]", "Slow (Potential startup bottleneck)",
+        tag, status, output = (TAG_WARN, "Slow (Potential startup bottleneck)",
                                f"{duration:.4f} seconds.")
 
     print(f"   {tag} Import Performance: {status} - {output}")
@@ -208,11 +328,11 @@ def print_environment_check():
         elif impl_name == "Jython":
             threading_model = "OS Threads (No GIL)"
 
-        print(f"   [INFO] Python Version: {py_version}")
-        print(f"   [INFO] Threading Model: {threading_model}")
-        print(f"   [INFO] Interpreter Implementation: {impl_name}")
+        print(f"   {TAG_INFO} Python Version: {py_version}")
+        print(f"   {TAG_INFO} Threading Model: {threading_model}")
+        print(f"   {TAG_INFO} Interpreter Implementation: {impl_name}")
     except Exception:  # pylint: disable=broad-exception-caught
-        print("   [WARN] Environment Info: Failed to retrieve interpreter version or details.")
+        print(f"   {TAG_WARN} Environment Info: Failed to retrieve interpreter version or details.")
 
 class ModuleAnalysis:  # pylint: disable=too-many-instance-attributes
     # ----------------------------------------
@@ -222,7 +342,14 @@ class ModuleAnalysis:  # pylint: disable=too-many-instance-attributes
     A class to perform a comprehensive analysis of a Python module's soundness.
     It separates the analysis logic from the presentation (printing) logic.
     """
-    def __init__(self, module_name: str):
+    __slots__ = ('module_name', 'accurate_type_hints', 'static_only', 'module_object',
+                 'module_namespace', 'module_file', 'module_path', 'module_type',
+                 'import_duration', 'captured_warnings', 'warnings_overflow',
+                 'package_metadata', 'public_members', 'private_members', 'all_members',
+                 'callables_to_analyze', 'n_public', 'n_private', 'n_total', 'n_callables')
+
+    def __init__(self, module_name: str, accurate_type_hints: bool = False,
+                 static_only: bool = False):
         """
         Initializes the analysis by importing the module and gathering key data.
         This constructor acts as the main entry point for the analysis, orchestrating
@@ -230,175 +357,263 @@ class ModuleAnalysis:  # pylint: disable=too-many-instance-attributes
 
         Args:
             module_name (str): The name of the module to analyze.
+            accurate_type_hints (bool): Use inspect.signature() for the type hint check
+                instead of the faster __annotations__ lookup.
+            static_only (bool): Locate the module via its import spec without executing it;
+                only the location, language and metadata checks are then run.
 
         Raises:
             ImportError: If the module cannot be imported.
             Exception: For other unexpected errors during import.
         """
         self.module_name = module_name
+        self.accurate_type_hints = accurate_type_hints
+        self.static_only = static_only
         self.module_object = None
+        self.module_namespace = {}
+        self.module_file = 'N/A'
+        self.module_path = None
+        self.module_type = None
         self.import_duration = 0.0
         self.captured_warnings = []
+        self.warnings_overflow = 0
         self.package_metadata = None
         self.public_members = []
         self.private_members = []
         self.all_members = []
         self.callables_to_analyze = []
+        self.n_public = self.n_private = self.n_total = self.n_callables = 0
 
-        self._import_module()
+        if static_only:
+            self._locate_module()
+        else:
+            self._import_module()
         self._gather_members()
         self._gather_metadata()
 
     def _import_module(self):
         """Imports the module, records duration, and captures warnings."""
+        import warnings  # pylint: disable=import-outside-toplevel
+        # Keep only the first record of each distinct (category, message) pair, up to a cap,
+        # so a module emitting warnings in a loop cannot grow the capture without bound
+        unique_warnings = {}
+
+        def record_warning(message, category, filename, lineno, file=None, line=None):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            key = (category.__name__, str(message))
+            if key in unique_warnings:
+                return
+            if len(unique_warnings) >= _MAX_CAPTURED_WARNINGS:
+                self.warnings_overflow += 1
+                return
+            unique_warnings[key] = warnings.WarningMessage(message, category, filename,
+                                                           lineno, file, line)
+
+        # Swap the hook and filter list by hand rather than through catch_warnings(), which
+        # snapshots more state than needed; only the filters and showwarning are touched here
+        saved_showwarning, saved_filters = warnings.showwarning, warnings.filters[:]
+        warnings.simplefilter("always")
+        warnings.showwarning = record_warning
         start_time = time.perf_counter()
         try:
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                self.module_object = importlib.import_module(self.module_name)
-                self.captured_warnings = list(w)
+            self.module_object = importlib.import_module(self.module_name)
         finally:
             self.import_duration = time.perf_counter() - start_time
+            warnings.showwarning = saved_showwarning
+            warnings.filters[:] = saved_filters
+            # Assigning the list in place bypasses the module's filter-version bump, so
+            # invalidate the C-level "already warned" caches explicitly where available
+            if hasattr(warnings, '_filters_mutated'):
+                warnings._filters_mutated()  # pylint: disable=protected-access
+            self.captured_warnings = list(unique_warnings.values())
+
+        try:
+            self.module_namespace = vars(self.module_object)
+        except TypeError:  # Replaced in sys.modules by an object without __dict__
+            self.module_namespace = {}
+        self.module_file = self._module_attr('__file__') or 'N/A'
+        self.module_path = getattr(self.module_object, '__path__', None)
+
+    def _module_attr(self, name: str) -> Any:
+        """
+        Reads a module-level attribute straight from the module's namespace dict.
+
+        Falls back to getattr() when the name is not in the namespace dict, which covers
+        modules defining __getattr__ (PEP 562) and objects without a __dict__.
+
+        Args:
+            name (str): The attribute name.
+
+        Returns:
+            Any: The attribute value, or None if it is not defined.
+        """
+        namespace = self.module_namespace
+        if name in namespace or self.module_object is None:
+            return namespace.get(name)
+        return getattr(self.module_object, name, None)
+
+    def _locate_module(self):
+        """Resolves the module's origin and search path from its spec, without importing it."""
+        from importlib import machinery, util  # pylint: disable=import-outside-toplevel
+        # find_spec('pkg.sub') would run 'pkg', so unimported packages are searched by path only
+        spec, parts = None, self.module_name.split('.')
+        for depth in range(1, len(parts) + 1):
+            name = '.'.join(parts[:depth])
+            if spec is None or name in sys.modules:
+                spec = util.find_spec(name)
+            else:  # A parent that is not a package has no locations to search
+                locations = spec.submodule_search_locations
+                spec = machinery.PathFinder.find_spec(name, locations) if locations else None
+            if spec is None:
+                raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+        # Frozen stdlib modules still record the source file they were built from
+        self.module_file = (spec.origin if spec.has_location and spec.origin else
+                            getattr(spec.loader_state, 'filename', None) or 'N/A')
+        self.module_path = spec.submodule_search_locations
 
     def _gather_members(self):
         """Gathers and categorizes all members of the module."""
+        import inspect  # pylint: disable=import-outside-toplevel
         if not self.module_object:
             return
 
-        all_dir_members = dir(self.module_object)
-        member_names = [m for m in all_dir_members if not m.startswith('__') or m == '__all__']
-
-        self.public_members = [m for m in member_names if not m.startswith('_')]
-        self.private_members = [m for m in member_names if m.startswith('_') and m != '__all__']
-        self.all_members = self.public_members + self.private_members
+        # A non-empty __all__ list is authoritative for the public API, so only its names are
+        # resolved; dir() is then scanned just for the private names
+        declared_api = self._module_attr('__all__')
+        public, private, callables = [], [], []
+        if isinstance(declared_api, list) and declared_api:
+            public = list(declared_api)
+            private = [name for name in dir(self.module_object)
+                       if name.startswith('_') and not name.startswith('__')]
+        else:
+            for name in dir(self.module_object):
+                if name.startswith('__'):
+                    continue
+                if name.startswith('_'):
+                    private.append(name)
+                else:
+                    public.append(name)
 
-        for name in self.public_members:
-            attr = getattr(self.module_object, name)
+        for name in public:
+            attr = getattr(self.module_object, name, None)
             if inspect.isfunction(attr) or inspect.isclass(attr):
-                self.callables_to_analyze.append(attr)
+                callables.append(attr)
+
+        self.public_members, self.private_members = public, private
+        self.all_members = public + private
+        self.callables_to_analyze = callables
+        self.n_public, self.n_private = len(public), len(private)
+        self.n_total = self.n_public + self.n_private
+        self.n_callables = len(callables)
 
     def _gather_metadata(self):
         """Retrieves package metadata if available."""
-        try:
-            self.package_metadata = importlib.metadata.metadata(self.module_name)
-        except importlib.metadata.PackageNotFoundError:
-            self.package_metadata = None
+        self.package_metadata = _get_metadata(self.module_name)
 
     def analyze_location(self) -> Dict[str, Any]:
         """Check 1: Determines the module's file or package location."""
-        file_path = getattr(self.module_object, '__file__', 'N/A')
-        module_path = getattr(self.module_object, '__path__', None)
+        file_path = self.module_file
+        module_path = self.module_path
 
         detail, status = "", ""
         if file_path != 'N/A':
             detail = f"File Path: {file_path}"
-            status = "[PASS]"
+            status = TAG_PASS
         elif module_path:
             detail = f"Is Package (Path): {module_path}"
-            status = "[PASS]"
+            status = TAG_PASS
         else:
             detail = "Built-in or C-Extension (No explicit file path found)."
-            status = "[INFO]"
+            status = TAG_INFO
 
         return {"title": "Module File/Package Location", "status_tag": status, "detail": detail}
 
-    def analyze_language_type(self) -> Dict[str, Any]:  # pylint: disable=too-many-nested-blocks
+    def analyze_language_type(self) -> Dict[str, Any]:
         """Check 2: Determines the implementation language (Python, C-extension, etc.)."""
-        # pylint: disable=too-many-nested-blocks
-        file_path = getattr(self.module_object, '__file__', 'N/A')
-        module_path = getattr(self.module_object, '__path__', None)
+        file_path = self.module_file
+        module_path = self.module_path
         module_type = "Built-in/Unknown"
 
-        file_path_lower = file_path.lower()
-        if file_path_lower.endswith(('.so', '.pyd', '.dll', '.dylib')):
+        extension = os.path.splitext(file_path)[1].lower()
+        is_package_init = os.path.basename(file_path).lower() == '__init__.py'
+        if extension in _C_EXTENSION_SUFFIXES:
             module_type = "C-Extension"
-        elif file_path_lower.endswith(('.py', '__init__.py')):
+        elif extension == '.py':
             module_type = "Pure Python"
         elif module_path:
             module_type = "Pure Python (Namespace)"
 
         # Check for mixed-language packages
-        dirs_to_check = ([os.path.dirname(file_path)] if '__init__.py' in file_path_lower
+        dirs_to_check = ([os.path.dirname(file_path)] if is_package_init
                          else (list(module_path) if module_path else []))
-        has_c_extensions_in_package = False
-        if dirs_to_check and "Pure Python" in module_type:
-            for d in dirs_to_check:
-                if os.path.exists(d):
-                    try:
-                        for filename in os.listdir(d):
-                            if filename.lower().endswith(('.so', '.pyd', '.dll', '.dylib')):
-                                has_c_extensions_in_package = True
-                                break
-                        if has_c_extensions_in_package:
-                            break
-                    except PermissionError:
-                        pass
+        has_c_extensions_in_package = ("Pure Python" in module_type and
+                                       any(_dir_has_c_extension(d) for d in dirs_to_check))
 
         if has_c_extensions_in_package:
             module_type = "Mixed (Python entry, uses C-extensions)"
+        self.module_type = module_type
 
-        status = ("[PASS]" if "C-Extension" in module_type or "Pure Python" in module_type or
-                  "Mixed" in module_type else "[INFO]")
+        status = (TAG_PASS if "C-Extension" in module_type or "Pure Python" in module_type or
+                  "Mixed" in module_type else TAG_INFO)
         return {"title": "Implementation Language Type", "status_tag": status,
                 "detail": f"Identified as: {module_type}."}
 
     def analyze_docstring(self) -> Dict[str, Any]:
         """Check 3: Checks for the presence and length of the module's docstring."""
-        docstring = getattr(self.module_object, '__doc__', None)
+        docstring = self._module_attr('__doc__')
         if docstring and len(docstring.strip()) > 10:
-            status = "[PASS]"
+            status = TAG_PASS
             detail = f"Found (Length: {len(docstring.strip())} characters)."
         else:
-            status = "[WARN]"
+            status = TAG_WARN
             detail = "Not found or too short. Module lacks descriptive text."
         return {"title": "Documentation String (__doc__)", "status_tag": status, "detail": detail}
 
     def analyze_version(self) -> Dict[str, Any]:
         """Check 4: Checks for the __version__ attribute."""
-        version = getattr(self.module_object, '__version__', None)
+        version = self._module_attr('__version__')
         if version:
-            status = "[PASS]"
+            status = TAG_PASS
             detail = f"Found (v{version})."
         else:
-            status = "[WARN]"
+            status = TAG_WARN
             detail = "Not found. Version tracking is absent (Recommended)."
         return {"title": "Version Information (__version__)", "status_tag": status,
                 "detail": detail}
 
     def analyze_public_api(self) -> Dict[str, Any]:
         """Check 5: Checks for the __all__ attribute to define a public API."""
-        all_list = getattr(self.module_object, '__all__', None)
+        all_list = self._module_attr('__all__')
         if all_list is not None and isinstance(all_list, list) and all_list:
-            status = "[PASS]"
+            status = TAG_PASS
             detail = f"Found (Defines {len(all_list)} public objects)."
         elif all_list is None:
-            status = "[INFO]"
+            status = TAG_INFO
             detail = "Not explicitly defined. Using default namespace."
         else:
-            status = "[WARN]"
+            status = TAG_WARN
             detail = "Defined but empty or not a list. Check package configuration."
         return {"title": "Public API Definition (__all__)", "status_tag": status, "detail": detail}
 
     def analyze_encapsulation(self) -> Dict[str, Any]:
         """Check 6: Analyzes the ratio of private to public members."""
-        total_members = len(self.all_members)
+        total_members = self.n_total
         sub_details = []
         if total_members > 0:
-            private_ratio = len(self.private_members) / total_members * 100
-            detail = (f"Total Members: {total_members} (Public: {len(self.public_members)}, "
-                      f"Private: {len(self.private_members)})")
+            private_ratio = self.n_private / total_members * 100
+            detail = (f"Total Members: {total_members} (Public: {self.n_public}, "
+                      f"Private: {self.n_private})")
 
-            if private_ratio > 70 and len(self.public_members) < 5:
-                status = "[WARN]"
+            if private_ratio > 70 and self.n_public < 5:
+                status = TAG_WARN
                 rating_string_full = "alert, >= 70% and <5 public members"
             else:
-                status = "[PASS]"
+                status = TAG_PASS
                 rating_string_full = "reasonable, < 70% or >= 5 public members"
 
             sub_details.append(f"Private member ratio: {private_ratio:.1f}%")
             sub_details.append(rating_string_full)
         else:
-            status = "[INFO]"
+            status = TAG_INFO
             detail = "Module namespace is empty (Only built-in attributes found)."
 
         return {"title": "Object Definition Quality/Encapsulation", "status_tag": status,
@@ -407,23 +622,23 @@ class ModuleAnalysis:  # pylint: disable=too-many-instance-attributes
     def analyze_api_surface_size(self) -> Dict[str, Any]:
         """Check 7: Checks if the public API surface is excessively large."""
         public_api_threshold = 150
-        if len(self.public_members) > public_api_threshold:
-            status = "[WARN]"
-            detail = (f"Excessive size detected ({len(self.public_members)} members). "
+        if self.n_public > public_api_threshold:
+            status = TAG_WARN
+            detail = (f"Excessive size detected ({self.n_public} members). "
                       "Consider segmenting.")
         else:
-            status = "[PASS]"
-            detail = f"Reasonable size ({len(self.public_members)} members)."
+            status = TAG_PASS
+            detail = f"Reasonable size ({self.n_public} members)."
         return {"title": "Public API Surface Size", "status_tag": status, "detail": detail}
 
     def analyze_callable_count(self) -> Dict[str, Any]:
         """Check 8: Counts the number of public callable objects (functions/classes)."""
         if self.callables_to_analyze:
-            status = "[PASS]"
-            detail = (f"Found {len(self.callables_to_analyze)} public functions/classes, "
+            status = TAG_PASS
+            detail = (f"Found {self.n_callables} public functions/classes, "
                       "indicating functionality.")
         else:
-            status = "[INFO]"
+            status = TAG_INFO
             detail = "No top-level public functions/classes found."
         return {"title": "Callable Object Count", "status_tag": status, "detail": detail}
 
@@ -431,47 +646,47 @@ class ModuleAnalysis:  # pylint: disable=too-many-instance-attributes
         """Check 9: Checks for warnings raised during module import."""
         sub_details = []
         if self.captured_warnings:
-            unique_warnings = set(str(warn.message) for warn in self.captured_warnings)
-            status = "[WARN]"
-            detail = f"{len(unique_warnings)} unique warnings detected during import."
+            status = TAG_WARN
+            detail = f"{len(self.captured_warnings)} unique warnings detected during import"
+            if self.warnings_overflow:
+                detail += f", {self.warnings_overflow} more not recorded"
+            detail += "."
             for warn in self.captured_warnings[:3]:
                 sub_details.append(f"({type(warn.message).__name__}) {str(warn.message)[:60]}...")
         else:
-            status = "[PASS]"
+            status = TAG_PASS
             detail = "No warnings or deprecations detected."
         return {"title": "Import Health (Warnings/Deprecations)", "status_tag": status,
                 "detail": detail, "sub_details": sub_details}
 
     def analyze_type_hint_coverage(self) -> Dict[str, Any]:
         """Check 10: Calculates the percentage of public callables with type hints."""
-        total_callables = len(self.callables_to_analyze)
+        total_callables = self.n_callables
         if not total_callables:
-            return {"title": "Type Hint Coverage", "status_tag": "[INFO]",
+            return {"title": "Type Hint Coverage", "status_tag": TAG_INFO,
                     "detail": "No public functions or classes available for analysis."}
 
-        annotated_callables = 0
-        for attr in self.callables_to_analyze:
-            try:
-                signature = inspect.signature(attr)
-                if signature.return_annotation is not inspect.Signature.empty:
-                    annotated_callables += 1
-                    continue
-                for param in signature.parameters.values():
-                    if param.annotation is not inspect.Parameter.empty:
-                        annotated_callables += 1
-                        break
-            except (ValueError, TypeError):
-                pass
+        # Compiled callables carry no Python annotations, so there is nothing to measure
+        if self.module_type is None:
+            self.analyze_language_type()
+        if self.module_type == "C-Extension":
+            return {"title": "Type Hint Coverage", "status_tag": TAG_INFO,
+                    "detail": "C-Extension module; Python annotations not applicable."}
+
+        has_annotations = (_signature_has_annotations if self.accurate_type_hints
+                           else _has_annotations)
+        annotated_callables = sum(1 for attr in self.callables_to_analyze
+                                  if has_annotations(attr))
 
         coverage = (annotated_callables / total_callables) * 100
         if coverage >= 75:
-            status, detail = "[PASS]", f"Excellent ({coverage:.0f}% of public callables annotated)."
+            status, detail = TAG_PASS, f"Excellent ({coverage:.0f}% of public callables annotated)."
         elif coverage >= 30:
-            status, detail = ("[WARN]",
+            status, detail = (TAG_WARN,
                               f"Moderate ({coverage:.0f}% of public callables annotated). "
                               "Aim higher.")
         else:
-            status, detail = ("[INFO]",
+            status, detail = (TAG_INFO,
                               f"Low ({coverage:.0f}% of public callables annotated). "
                               "Recommended for public APIs.")
 
@@ -483,13 +698,13 @@ class ModuleAnalysis:  # pylint: disable=too-many-instance-attributes
             name = self.package_metadata.get('Name')
             version = self.package_metadata.get('Version')
             if name and version:
-                status, detail = ("[PASS]",
+                status, detail = (TAG_PASS,
                               f"Found package '{name}' (v{version}) via importlib.metadata.")
             else:
-                status, detail = ("[WARN]",
+                status, detail = (TAG_WARN,
                                   "Metadata found, but name/version information is incomplete.")
         else:
-            status, detail = ("[WARN]",
+            status, detail = (TAG_WARN,
                               "Package not found in distribution database "
                               "(May be standalone/built-in).")
         return {"title": "Distribution Metadata Status", "status_tag": status, "detail": detail}
@@ -497,38 +712,39 @@ class ModuleAnalysis:  # pylint: disable=too-many-instance-attributes
     def analyze_license_status(self) -> Dict[str, Any]:
         """Check 12: Checks for license information in package metadata."""
         if not self.package_metadata:
-            return {"title": "License Status", "status_tag": "[INFO]",
+            return {"title": "License Status", "status_tag": TAG_INFO,
                     "detail": "Could not retrieve package metadata."}
 
         license_text = self.package_metadata.get('License')
         if license_text:
-            match = re.search(r'(MIT|BSD|Apache|GPL|LGPL|Public Domain)', license_text,
-                              re.IGNORECASE)
-            detail = (f"{match.group(1).upper()} License detected." if match
+            # Report the keyword that occurs first in the text, e.g. "LGPL" rather than "GPL"
+            license_upper = license_text.upper()
+            hits = [(license_upper.find(kw), kw) for kw in _LICENSE_KEYWORDS
+                    if kw in license_upper]
+            detail = (f"{min(hits)[1]} License detected." if hits
                       else "Custom/Complex License detected.")
-            status = "[PASS]"
+            status = TAG_PASS
         else:
-            status, detail = "[WARN]", "'License' field missing in package metadata."
+            status, detail = TAG_WARN, "'License' field missing in package metadata."
 
         return {"title": "License Status", "status_tag": status, "detail": detail}
 
     def analyze_dependencies(self) -> Dict[str, Any]:
         """Check 13: Analyzes mandatory and optional dependencies from metadata."""
         if not self.package_metadata:
-            return {"title": "Required Dependencies", "status_tag": "[INFO]",
+            return {"title": "Required Dependencies", "status_tag": TAG_INFO,
                     "detail": "Could not retrieve package metadata."}
 
         requires_dist = self.package_metadata.get_all('Requires-Dist')
         if not requires_dist:
-            return {"title": "Required Dependencies", "status_tag": "[PASS]",
+            return {"title": "Required Dependencies", "status_tag": TAG_PASS,
                     "detail": "No external package dependencies listed (Self-contained)."}
 
         mandatory = set()
         optional = set()
         for req in requires_dist:
-            match = re.match(r'([A-Za-z0-9._-]+)', req)
-            if match:
-                dep_name = match.group(1)
+            dep_name = _requirement_name(req)
+            if dep_name:
                 if ';' in req:
                     optional.add(dep_name)
                 else:
@@ -539,18 +755,18 @@ class ModuleAnalysis:  # pylint: disable=too-many-instance-attributes
         total_deps = num_mandatory + num_optional
 
         if total_deps == 0:
-            return {"title": "Required Dependencies", "status_tag": "[PASS]",
+            return {"title": "Required Dependencies", "status_tag": TAG_PASS,
                     "detail": "No external package dependencies listed (Self-contained)."}
 
         detail = (f"Found {total_deps} unique external packages ({num_mandatory} mandatory, "
                   f"{num_optional} optional/conditional).")
         sub_details = []
         if mandatory:
-            sub_details.append(f"MANDATORY: {'; '.join(sorted(list(mandatory)))}")
+            sub_details.append(f"MANDATORY: {'; '.join(sorted(mandatory))}")
         if truly_optional:
-            sub_details.append(f"OPTIONAL/CONDITIONAL: {'; '.join(sorted(list(truly_optional)))}")
+            sub_details.append(f"OPTIONAL/CONDITIONAL: {'; '.join(sorted(truly_optional))}")
 
-        return {"title": "Required Dependencies", "status_tag": "[INFO]", "detail": detail,
+        return {"title": "Required Dependencies", "status_tag": TAG_INFO, "detail": detail,
                 "sub_details": sub_details}
 
     def run_all_checks(self) -> List[Dict[str, Any]]:
@@ -561,31 +777,145 @@ class ModuleAnalysis:  # pylint: disable=too-many-instance-attributes
         Returns:
             A list of dictionaries, where each dictionary represents the result of a check.
         """
-        results_list = [
-            self.analyze_location(),
-            self.analyze_language_type(),
-            self.analyze_docstring(),
-            self.analyze_version(),
-            self.analyze_public_api(),
-            self.analyze_encapsulation(),
-            self.analyze_api_surface_size(),
-            self.analyze_callable_count(),
-            self.analyze_import_health(),
-            self.analyze_type_hint_coverage(),
-            self.analyze_metadata_status(),
-            self.analyze_license_status(),
-            self.analyze_dependencies(),
-        ]
-        # Add a number to each result for presentation purposes
-        for i, result in enumerate(results_list):
-            result['num'] = i + 1
+        checks = (
+            self.analyze_location,
+            self.analyze_language_type,
+            self.analyze_docstring,
+            self.analyze_version,
+            self.analyze_public_api,
+            self.analyze_encapsulation,
+            self.analyze_api_surface_size,
+            self.analyze_callable_count,
+            self.analyze_import_health,
+            self.analyze_type_hint_coverage,
+            self.analyze_metadata_status,
+            self.analyze_license_status,
+            self.analyze_dependencies,
+        )
+        results_list = []
+        for num, check in enumerate(checks, start=1):
+            if self.static_only and num not in _STATIC_CHECK_NUMBERS:
+                continue
+            result = check()
+            # Add the check number for presentation purposes
+            result['num'] = num
+            results_list.append(result)
 
         return results_list
 
+def run_module_test(module_name: str, accurate_type_hints: bool = False,
+                    static_only: bool = False) -> Dict[str, Any]:
+    """
+    Analyzes one module and returns a picklable summary of the outcome.
+    Used directly for a single module and as the worker function in --batch mode.
+
+    Args:
+        module_name (str): The name of the module to analyze.
+        accurate_type_hints (bool): Passed through to ModuleAnalysis.
+        static_only (bool): Passed through to ModuleAnalysis.
+
+    Returns:
+        Dict[str, Any]: The module name and an 'outcome' of 'ok' (with 'results' and
+            'import_duration'), 'import_error' or 'error' (with 'error_type' and 'error').
+    """
+    try:
+        analysis = ModuleAnalysis(module_name, accurate_type_hints, static_only)
+        return {"module_name": module_name, "outcome": "ok",
+                "results": analysis.run_all_checks(),
+                "import_duration": analysis.import_duration}
+    except ImportError as e:
+        return {"module_name": module_name, "outcome": "import_error", "error": str(e)}
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return {"module_name": module_name, "outcome": "error",
+                "error_type": type(e).__name__, "error": str(e)}
+
+def run_isolated_module_test(module_name: str, accurate_type_hints: bool = False,
+                             static_only: bool = False) -> Dict[str, Any]:
+    """
+    Runs run_module_test() in a fresh worker process dedicated to this one module, so that
+    no import state (sys.modules, warnings filters, timings) is shared with other modules,
+    and a worker that crashes or exits only fails its own module.
+
+    Args:
+        module_name (str): The name of the module to analyze.
+        accurate_type_hints (bool): Passed through to ModuleAnalysis.
+        static_only (bool): Passed through to ModuleAnalysis.
+
+    Returns:
+        Dict[str, Any]: The summary from run_module_test(), or an 'error' outcome if the
+            worker process could not complete it.
+    """
+    # pylint: disable=import-outside-toplevel
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    # A fresh interpreter per module: forking the caller, which runs a thread per worker,
+    # is unsafe, and the forkserver start method is cheaper than spawn where available.
+    start_method = ("forkserver" if "forkserver" in multiprocessing.get_all_start_methods()
+                    else "spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=1,
+                                 mp_context=multiprocessing.get_context(start_method)) as worker:
+            return worker.submit(run_module_test, module_name, accurate_type_hints,
+                                   static_only).result()
+    except BrokenProcessPool:
+        return {"module_name": module_name, "outcome": "error", "error_type": "WorkerCrash",
+                "error": "The worker process terminated abruptly (crash or exit during import)."}
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return {"module_name": module_name, "outcome": "error",
+                "error_type": type(e).__name__, "error": str(e)}
+
+def print_module_test(test: Dict[str, Any], static_only: bool = False):
+    """
+    Prints the report for one module test, or the reason it failed.
+
+    Args:
+        test (Dict[str, Any]): A summary as returned by run_module_test().
+        static_only (bool): Whether the module was only located, not imported.
+    """
+    module_name = test["module_name"]
+    print(f"Locating '{module_name}' (static analysis, not imported)..."
+          if static_only else f"Testing import of '{module_name}'...")
+
+    if test["outcome"] == "ok":
+        done = "located" if static_only else "imported correctly"
+        print(f"{TAG_OK} SUCCESS: Module '{module_name}' {done}.")
+        print_report(test["results"])
+        if not static_only:
+            print_performance_check(test["import_duration"])
+    elif test["outcome"] == "import_error":
+        print("\n--- Import Failure ---")
+        print(f"{TAG_FAIL} FAILURE: Module '{module_name}' could not be "
+              f"{'located' if static_only else 'imported'}.")
+        print(f"   Error: {test['error']}")
+        print(f"   Suggestion: Ensure the package is installed (e.g., 'pip install "
+              f"{module_name}')")
+    else:
+        print("\n--- Unexpected Failure ---")
+        print(f"{TAG_FAIL} FAILURE: An unexpected error occurred while loading '{module_name}'.")
+        print(f"   Error Type: {test['error_type']}")
+        print(f"   Details: {test['error']}")
+
+def read_module_list(path: str) -> List[str]:
+    """
+    Reads module names from a file, one per line; blank lines and '#' comments are skipped.
+
+    Args:
+        path (str): The file to read.
+
+    Returns:
+        List[str]: The module names, in file order.
+    """
+    with open(path, encoding="utf-8") as handle:
+        return [name for line in handle if (name := line.split('#', 1)[0].strip())]
+
 if __name__ == "__main__":
     # ----------------------------------------
     # Main Execution Block
     # ----------------------------------------
+    # Deferred so that importing this file as a library stays cheap.
+    import argparse  # pylint: disable=import-outside-toplevel
 
     parser = argparse.ArgumentParser(
         description=("Check if a specified Python module can be imported successfully and "
@@ -606,12 +936,41 @@ if __name__ == "__main__":
         help="Display the methodology and rating explanations for all checks, then exit."
     )
 
+    parser.add_argument(
+        "--accurate-type-hints",
+        action='store_true',
+        help="Use full signature introspection for the type hint check (slower)."
+    )
+
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help=("Analyze every module listed in FILE (one per line), each in its own worker "
+              "process.")
+    )
+
+    parser.add_argument(
+        "--static-only",
+        action='store_true',
+        help=("Locate the module without importing it and run only the location, language "
+              "and metadata checks (1, 2, 11-13).")
+    )
+
     args = parser.parse_args()
 
     if args.checks_methodology:
         print_methodology_doc()
 
-    if not args.module_name:
+    if args.module_name and args.batch:
+        parser.error("module_name and --batch are mutually exclusive")
+
+    if args.batch:
+        try:
+            module_names = read_module_list(args.batch)
+        except OSError as e:
+            parser.error(f"cannot read --batch file: {e}")
+
+    if not args.module_name and not args.batch:
         if not args.checks_methodology:
             parser.print_help()
         sys.exit(0)
@@ -620,27 +979,22 @@ if __name__ == "__main__":
     print("PYTHON MODULE LOADING TEST UTILITY")
     print("=" * 40)
 
-    try:
-        print(f"Testing import of '{args.module_name}'...")
-        mod_analysis = ModuleAnalysis(args.module_name)
-        print(f"[OK] SUCCESS: Module '{args.module_name}' imported correctly.")
-
-        check_results = mod_analysis.run_all_checks()
-
-        print_report(check_results)
-        print_performance_check(mod_analysis)
+    if args.batch:
+        from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+        # Each thread drives one single-module worker process; results print in file order.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            tests = executor.map(run_isolated_module_test, module_names,
+                                 [args.accurate_type_hints] * len(module_names),
+                                 [args.static_only] * len(module_names))
+            for module_test in tests:
+                print_module_test(module_test, args.static_only)
+                print("=" * 40)
         print_environment_check()
-
-    except ImportError as e:
-        print("\n--- Import Failure ---")
-        print(f"[FAIL] FAILURE: Module '{args.module_name}' could not be imported.")
-        print(f"   Error: {e}")
-        print(f"   Suggestion: Ensure the package is installed (e.g., 'pip install "
-              f"{args.module_name}')")
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        print("\n--- Unexpected Failure ---")
-        print(f"[FAIL] FAILURE: An unexpected error occurred while loading '{args.module_name}'.")
-        print(f"   Error Type: {type(e).__name__}")
-        print(f"   Details: {e}")
-    finally:
+        print("=" * 40)
+    else:
+        module_test = run_module_test(args.module_name, args.accurate_type_hints,
+                                      args.static_only)
+        print_module_test(module_test, args.static_only)
+        if module_test["outcome"] == "ok":
+            print_environment_check()
         print("=" * 40)
@@ -18,7 +18,8 @@ Core Functionality:
        - Classifies packages as 'system', 'user', or 'custom' based on path.
 
     2. Bulk Upgrade (--upgrade):
-       - Identifies outdated packages using `pip list --outdated`.
+       - Identifies outdated packages by comparing installed versions with the latest
+         PyPI versions in-process (or with `pip list --outdated`, via --use-pip-outdated).
        - Performs a bulk upgrade of all identified packages.
        - Supports a simulation mode (--simulate) to preview changes without acting.
 
@@ -27,47 +28,77 @@ Core Functionality:
          helper functions, ensuring consistency with `python_pkg_info.py`.
 """
 
-import argparse
 import sys
-import json
-import subprocess
 import importlib.metadata
+import operator
 import os
-import shutil
 from pathlib import Path
-from python_pkg_utils import resolve_package_metadata
 
-def list_all_packages(json_output=False):
+# The utility module raises ImportError on unsupported Python versions; as a command-line
+# tool, exit with its message.
+try:
+    from python_pkg_utils import (fetch_latest_versions, get_distribution_name,
+                                  is_newer_version, resolve_package_metadata, set_pypi_cache,
+                                  set_top_level_index)
+except ImportError as import_error:
+    raise SystemExit(f"Error: {import_error}") from import_error
+
+# Maximum number of packages passed to a single 'pip install' run. This bounds the command
+# line, and a resolver conflict only aborts the batch it occurs in.
+PIP_INSTALL_BATCH_SIZE = 50
+
+def list_all_packages(json_output=False, offline=False):
     """
     Lists all installed packages with their metadata.
 
     Args:
         json_output (bool): If True, prints the output in JSON format.
+        offline (bool): If True, skip the PyPI lookups and report the latest versions as
+                        "(offline)". The table output never shows them, so it never looks
+                        them up.
     """
-    # Retrieve all package distributions from the current environment.
-    dists = importlib.metadata.distributions()
+    # Retrieve all package distributions from the current environment in a single scan of
+    # sys.path, reading only each distribution's METADATA name header to build its sort entry.
+    name_entries = []
+    for dist in importlib.metadata.distributions():
+        package_name = get_distribution_name(dist)
+        name_entries.append((package_name.lower(), package_name, dist))
+
+    # Sort by the pre-computed lowercase name for consistent ordering.
+    name_entries.sort(key=operator.itemgetter(0))
     package_list = []
 
-    # Sort distributions by package name for consistent ordering.
-    for dist in sorted(dists, key=lambda d: d.metadata['name'].lower()):
-        package_name = dist.metadata['name']
-        # Use a shared utility function to get detailed metadata for each package.
-        metadata = resolve_package_metadata(package_name)
+    for _, package_name, dist in name_entries:
+        # Use a shared utility function to get detailed metadata for each package. Passing
+        # the distribution found above avoids a fresh sys.path scan per package.
+        # The table shows no METADATA-only field, so only the JSON output parses METADATA.
+        metadata = resolve_package_metadata(package_name, fetch_latest=False, dist=dist,
+                                            summary_only=not json_output)
         if 'error' not in metadata:
             package_list.append(metadata)
 
     # Output the data in the specified format.
     if json_output:
-        print(json.dumps(package_list, indent=4))
+        if offline:
+            for metadata in package_list:
+                metadata['latest_version'] = "(offline)"
+        else:
+            # Look up all latest versions in one concurrent batch rather than one blocking
+            # request per package; results are collected before anything is printed.
+            latest_versions = fetch_latest_versions(metadata['package_name']
+                                                    for metadata in package_list)
+            for metadata in package_list:
+                metadata['latest_version'] = latest_versions[metadata['package_name']]
+        from python_json_utils import print_json  # pylint: disable=import-outside-toplevel
+        print_json(package_list)
     else:
-        # Print a formatted table for human-readable output.
+        # Print a formatted table for human-readable output, built in full and written at once.
         header = f"{'Package':<30} {'Version':<15} {'Location':<10} {'Type':<18} {'Path'}"
-        print(header)
-        print("=" * (len(header) + 5))
-        for metadata in package_list:
-            print(f"{metadata['package_name']:<30} {metadata['current_version']:<15} "
-                  f"{metadata['location_category']:<10} {metadata['module_type']:<18} "
-                  f"{metadata['exact_path']}")
+        lines = [header, "=" * (len(header) + 5)]
+        lines.extend(f"{metadata['package_name']:<30} {metadata['current_version']:<15} "
+                     f"{metadata['location_category']:<10} {metadata['module_type']:<18} "
+                     f"{metadata['exact_path']}" for metadata in package_list)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def get_outdated_packages():
     """
@@ -76,6 +107,9 @@ def get_outdated_packages():
     Returns:
         list: A list of dictionaries, where each dictionary represents an outdated package.
     """
+    import json  # pylint: disable=import-outside-toplevel
+    import subprocess  # pylint: disable=import-outside-toplevel
+
     try:
         # Execute 'pip list' with the '--outdated' and '--format=json' flags
         # to get a machine-readable list of packages that need upgrading.
@@ -91,6 +125,27 @@ def get_outdated_packages():
         print(f"Error checking for outdated packages: {e}", file=sys.stderr)
         return []
 
+def get_outdated_packages_inproc():
+    """
+    Gets a list of outdated packages without spawning pip, by comparing each installed
+    version with its latest PyPI version (looked up concurrently, through the shared cache).
+
+    Returns:
+        list: A list of dictionaries shaped like the output of 'pip list --outdated
+              --format=json' ('name', 'version', 'latest_version'), sorted by name.
+    """
+    # Only the first distribution found for a name is the one that is imported, as for pip.
+    installed = {}
+    for dist in importlib.metadata.distributions():
+        package_name = get_distribution_name(dist)
+        if package_name:
+            installed.setdefault(package_name.lower(), (package_name, dist.version))
+
+    latest_versions = fetch_latest_versions(name for name, _ in installed.values())
+    return [{'name': name, 'version': version, 'latest_version': latest_versions[name]}
+            for _, (name, version) in sorted(installed.items())
+            if is_newer_version(latest_versions[name], version)]
+
 def remove_old_package_from_target(package_name, target_path):
     """
     Removes the old version of a package from the target directory
@@ -100,10 +155,13 @@ def remove_old_package_from_target(package_name, target_path):
         package_name (str): The name of the package to remove.
         target_path (str): The target directory where the package is installed.
     """
+    import shutil  # pylint: disable=import-outside-toplevel
+
     abs_target = os.path.realpath(os.path.abspath(target_path))
 
-    # 1. Resolve and remove the package source (module/package)
-    metadata = resolve_package_metadata(package_name)
+    # 1. Resolve and remove the package source (module/package). Only the local path is
+    # needed, so neither PyPI nor the full METADATA is consulted.
+    metadata = resolve_package_metadata(package_name, fetch_latest=False, summary_only=True)
     if 'error' not in metadata:
         install_path = metadata['exact_path']
         # Check if the package is actually installed in the target directory
@@ -126,9 +184,10 @@ def remove_old_package_from_target(package_name, target_path):
         dist = importlib.metadata.distribution(package_name)
         files = dist.files
         if files:
-            # Find the path to .dist-info
-            dist_info_file = next((f for f in files if '.dist-info' in str(f)
-                                   or '.egg-info' in str(f)), None)
+            # Find the path to .dist-info (short-circuits on the first match, and
+            # stringifies each entry only once)
+            dist_info_file = next((f for f in files
+                                   if '.dist-info' in (s := str(f)) or '.egg-info' in s), None)
             if dist_info_file:
                 full_path = str(dist.locate_file(dist_info_file))
                 # Walk up to the .dist-info directory
@@ -145,7 +204,70 @@ def remove_old_package_from_target(package_name, target_path):
     except (importlib.metadata.PackageNotFoundError, OSError):
         pass
 
-def upgrade_modules(simulate=False, json_output=False, target_path=None):  # pylint: disable=too-many-branches
+def run_pip_install(command):
+    """
+    Runs a pip command, streaming its merged stdout/stderr to stdout as it arrives.
+
+    Args:
+        command (list): The full command line to execute.
+
+    Returns:
+        int: The exit status of the command.
+
+    Raises:
+        FileNotFoundError: If the Python executable cannot be found.
+    """
+    import subprocess  # pylint: disable=import-outside-toplevel
+
+    # Stream the merged output as raw bytes, in arrival order. A single pipe cannot fill up
+    # unread (and block pip) while the other is drained.
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          bufsize=0) as proc:
+        output_fd = proc.stdout.fileno()
+        sys.stdout.flush()
+        while chunk := os.read(output_fd, 65536):
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+        return proc.wait()
+
+def install_in_batches(base_command, package_names, strict=False):
+    """
+    Installs packages with one pip run per batch of PIP_INSTALL_BATCH_SIZE names. The packages
+    of a failed batch are retried one by one, so that a single conflict does not hold back
+    the others.
+
+    Args:
+        base_command (list): The pip command line, without package names.
+        package_names (list): The names of the packages to install.
+        strict (bool): If True, stop at the first failed batch instead of retrying it.
+
+    Returns:
+        list: The names of the packages that could not be installed (in strict mode, the
+              failed batch and every batch after it).
+
+    Raises:
+        FileNotFoundError: If the Python executable cannot be found.
+    """
+    failed = []
+    for start in range(0, len(package_names), PIP_INSTALL_BATCH_SIZE):
+        batch = package_names[start:start + PIP_INSTALL_BATCH_SIZE]
+        returncode = run_pip_install(base_command + batch)
+        if returncode == 0:
+            continue
+
+        print(f"\npip exited with status {returncode} for: {', '.join(batch)}",
+              file=sys.stderr)
+        if strict:
+            return package_names[start:]
+        if len(batch) > 1:
+            print("Retrying these packages one at a time...", file=sys.stderr)
+            failed.extend(name for name in batch if run_pip_install(base_command + [name]) != 0)
+        else:
+            failed.extend(batch)
+    return failed
+
+def upgrade_modules(simulate=False, json_output=False, target_path=None,
+                    use_pip_outdated=False, strict=False):
     """
     Upgrades all installed Python modules.
 
@@ -153,13 +275,18 @@ def upgrade_modules(simulate=False, json_output=False, target_path=None):  # pyl
         simulate (bool): If True, lists the packages to be upgraded without performing the upgrade.
         json_output (bool): If True and in simulation mode, prints the output in JSON format.
         target_path (str): Optional. Specifies the target directory for installation.
+        use_pip_outdated (bool): If True, detect outdated packages with 'pip list --outdated'
+                                 instead of the in-process PyPI lookups.
+        strict (bool): If True, stop at the first batch that pip fails to install.
     """
-    outdated_packages = get_outdated_packages()
+    outdated_packages = (get_outdated_packages() if use_pip_outdated
+                         else get_outdated_packages_inproc())
 
     if not outdated_packages:
         # If there are no outdated packages, inform the user and exit.
         if json_output and simulate:
-            print(json.dumps([]))
+            from python_json_utils import print_json  # pylint: disable=import-outside-toplevel
+            print_json([])
         else:
             print("All packages are up to date.")
         return
@@ -167,54 +294,49 @@ def upgrade_modules(simulate=False, json_output=False, target_path=None):  # pyl
     # If in simulation mode, just print the list of outdated packages.
     if simulate:
         if json_output:
-            print(json.dumps(outdated_packages, indent=4))
+            from python_json_utils import print_json  # pylint: disable=import-outside-toplevel
+            print_json(outdated_packages)
         else:
-            print(f"{'Module':<30} {'Old Version':<15} {'New Version':<15}")
-            print("="*60)
-            for package in outdated_packages:
-                print(f"{package['name']:<30} {package['version']:<15} "
-                      f"{package['latest_version']:<15}")
+            lines = [f"{'Module':<30} {'Old Version':<15} {'New Version':<15}", "=" * 60]
+            lines.extend(f"{package['name']:<30} {package['version']:<15} "
+                         f"{package['latest_version']:<15}" for package in outdated_packages)
+            sys.stdout.write("\n".join(lines) + "\n")
+        return
+
+    # If not in simulation mode, proceed with the upgrade.
+    package_names = [pkg['name'] for pkg in outdated_packages]
+    print(f"Upgrading {len(package_names)} packages...")
+
+    # Construct the 'pip install --upgrade' command.
+    command = [sys.executable, '-m', 'pip', 'install', '--upgrade']
+
+    if target_path:
+        command.extend(['--target', target_path])
+        # Pre-cleanup: Remove old versions from target path to avoid duplicates
+        for pkg_name in package_names:
+            remove_old_package_from_target(pkg_name, target_path)
+
+    try:
+        failed = install_in_batches(command, package_names, strict=strict)
+    except FileNotFoundError:
+        print(f"Error: The command '{command[0]}' was not found.", file=sys.stderr)
+        return
+
+    if failed:
+        # pip's error output has already been streamed above.
+        print(f"\nFailed to upgrade {len(failed)} of {len(package_names)} packages: "
+              f"{', '.join(failed)}", file=sys.stderr)
     else:
-        # If not in simulation mode, proceed with the upgrade.
-        package_names = [pkg['name'] for pkg in outdated_packages]
-        print(f"Upgrading {len(package_names)} packages...")
-
-        # Construct the 'pip install --upgrade' command.
-        command = [sys.executable, '-m', 'pip', 'install', '--upgrade']
-
-        if target_path:
-            command.extend(['--target', target_path])
-            # Pre-cleanup: Remove old versions from target path to avoid duplicates
-            for pkg_name in package_names:
-                remove_old_package_from_target(pkg_name, target_path)
-
-        command.extend(package_names)
-
-        try:
-            # Use Popen to stream the output of the upgrade process in real-time.
-            with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                  text=True) as proc:
-                if proc.stdout:
-                    for line in proc.stdout:
-                        print(line, end='')
-                proc.wait() # Wait for the subprocess to complete.
-
-                # Check for errors after the process has finished.
-                if proc.returncode != 0 and proc.stderr:
-                    stderr_output = "".join(proc.stderr.readlines())
-                    raise subprocess.CalledProcessError(proc.returncode, command,
-                                                        stderr=stderr_output)
-
-            print("\nSuccessfully upgraded all packages.")
-        except subprocess.CalledProcessError as e:
-            print(f"\nFailed to upgrade packages. Error:\n{e.stderr}", file=sys.stderr)
-        except FileNotFoundError:
-            print(f"Error: The command '{command[0]}' was not found.", file=sys.stderr)
+        print("\nSuccessfully upgraded all packages.")
 
 def main():
     """
     Main function to parse arguments and execute the appropriate action.
     """
+    # Deferred like the modules that only some paths need (subprocess, shutil, json), so that
+    # importing this file as a library stays cheap.
+    import argparse  # pylint: disable=import-outside-toplevel
+
     # Set up the command-line argument parser.
     parser = argparse.ArgumentParser(
         description="A tool to list and upgrade Python modules."
@@ -248,6 +370,35 @@ def main():
         '--target',
         help='Specify a target directory for the upgrade installation (works with --upgrade).'
     )
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Stop at the first batch of packages that pip fails to upgrade, instead of '
+             'retrying its packages one by one (works with --upgrade).'
+    )
+    parser.add_argument(
+        '--use-pip-outdated',
+        action='store_true',
+        help="Detect outdated packages with 'pip list --outdated' instead of in-process "
+             "PyPI lookups (works with --upgrade)."
+    )
+    parser.add_argument(
+        '--offline', '--no-latest',
+        dest='offline',
+        action='store_true',
+        help='Do not look up the latest versions on PyPI (works with --list --json; the '
+             'table output never looks them up).'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always query PyPI for latest versions, bypassing the on-disk cache.'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Revalidate every cached PyPI version with PyPI, regardless of its age.'
+    )
 
     # If the script is run without arguments, print the help message.
     if len(sys.argv) == 1:
@@ -256,11 +407,17 @@ def main():
 
     args = parser.parse_args()
 
+    # Latest versions are memoized per process and cached on disk by python_pkg_utils.
+    set_pypi_cache(enabled=not args.no_cache, ttl=0 if args.refresh else None)
+
     # Call the appropriate function based on the parsed arguments.
     if args.list:
-        list_all_packages(json_output=args.json)
+        # Every installed package is resolved, so one index of top-level names pays off.
+        set_top_level_index(True)
+        list_all_packages(json_output=args.json, offline=args.offline)
     elif args.upgrade:
-        upgrade_modules(simulate=args.simulate, json_output=args.json, target_path=args.target)
+        upgrade_modules(simulate=args.simulate, json_output=args.json, target_path=args.target,
+                        use_pip_outdated=args.use_pip_outdated, strict=args.strict)
 
 if __name__ == "__main__":
     # This block ensures the main function is called only when the script is executed directly.
@@ -13,71 +13,378 @@ Core Design Principles:
 1. Reliability: Uses the standard `importlib.metadata` library for robust metadata access and
    employs a multi-step heuristic to reliably determine a package's on-disk location.
 2. Modularity: Consolidates shared logic to avoid code duplication across different tools.
-3. Graceful Degradation: Includes a dummy `requests` class to prevent crashes if the library
-   is not installed, allowing network-dependent functions to fail gracefully.
-4. Python Version Guard: Explicitly checks for the minimum required Python version (3.8+)
-   to ensure compatibility with `importlib.metadata`.
+3. Graceful Degradation: `requests` is only imported on the first PyPI lookup, so local-only
+   callers never pay for it, and a missing library makes network-dependent functions fail
+   gracefully instead of crashing.
+4. Python Version Guard: Checks the minimum required Python version (3.8+) once, at import
+   and before `importlib.metadata` is imported, raising ImportError so that importing
+   programs can handle it (the command-line tools exit with the message).
 """
 
+import sys
+
+# The minimum required Python version (3.8) is necessary because `importlib.metadata`
+# was introduced as a standard library module in that version.
+MIN_PYTHON_VERSION_TUPLE = (3, 8)
+
+# Checked once, before importing `importlib.metadata` (which would fail first on older
+# versions), rather than on every metadata lookup.
+if sys.version_info < MIN_PYTHON_VERSION_TUPLE:
+    raise ImportError(f"Python {'.'.join(map(str, MIN_PYTHON_VERSION_TUPLE))} or newer "
+                      "is required for metadata handling.")
+
+# pylint: disable=wrong-import-position
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+import enum
+import functools
+import hashlib
+import importlib.machinery
 import importlib.metadata
 import importlib.util
+import json
+import logging
 import os
-import sys
+import re
+import tempfile
+import threading
+import time
 from pathlib import Path
 import site
+# pylint: enable=wrong-import-position
 
-# Define a dummy class to gracefully handle the absence of the 'requests' library.
-# This prevents the entire script from failing if 'requests' is not installed,
-# allowing other non-network functionalities to proceed.
-class DummyRequests:  # pylint: disable=too-few-public-methods
-    """A dummy class that mimics the `requests` library's interface for PyPI lookups."""
-    @staticmethod
-    def get(url, timeout):  # pylint: disable=unused-argument
-        """Simulates a failed GET request, returning a 503 status code."""
-        class DummyResponse:  # pylint: disable=too-few-public-methods,missing-class-docstring
-            status_code = 503  # Service Unavailable
-            @staticmethod
-            def json():
-                """Returns a JSON object indicating the error."""
-                return {'info': {'version': 'Error: requests not installed'}}
-        return DummyResponse()
-
-# Attempt to import the 'requests' library for network operations. If it fails,
-# substitute it with the DummyRequests class to ensure the script remains operational.
+# The optional 'packaging' library is needed to order the versions listed by the PyPI
+# Simple API, and to tell which of them are yanked from its file names. Without it, lookups
+# use the larger PyPI JSON API, which names the latest version itself.
 try:
-    import requests
+    from packaging.utils import (InvalidSdistFilename, InvalidWheelFilename,
+                                 parse_sdist_filename, parse_wheel_filename)
+    from packaging.version import InvalidVersion, Version
+    HAS_PACKAGING = True
 except ImportError:
-    requests = DummyRequests()
+    HAS_PACKAGING = False
 
 # ====================================================================
 # CONFIGURATION CONSTANTS
 # ====================================================================
 
-# The minimum required Python version (3.8) is necessary because `importlib.metadata`
-# was introduced as a standard library module in that version.
-MIN_PYTHON_VERSION_TUPLE = (3, 8)
+# The official PyPI JSON API endpoint for fetching package metadata
+# (`<prefix><project>/json`).
+PYPI_JSON_URL_PREFIX = "https://pypi.org/pypi/"
+
+# The PyPI Simple API endpoint (`<prefix><project>/`) and its JSON content type (PEP 691).
+# Its response lists the project's versions (PEP 700) without the release descriptions of
+# the JSON API.
+PYPI_SIMPLE_URL_PREFIX = "https://pypi.org/simple/"
+PYPI_SIMPLE_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+
+# User-Agent sent with PyPI lookups, identifying this tool to the PyPI operators.
+PYPI_USER_AGENT = "python_pkg_utils/1.0.0"
+
+# Timeouts for PyPI lookups, as a (connect, read) pair in seconds.
+PYPI_TIMEOUT = (3.05, 5)
+
+# Upper bound on concurrent PyPI lookups, kept low to stay well within PyPI's rate limits.
+PYPI_MAX_WORKERS = 8
+
+# Directory holding cached PyPI responses (one JSON file per package), honoring XDG_CACHE_HOME.
+PYPI_CACHE_DIR = (Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+                  / 'python_pkg_utils')
+
+# Cached PyPI versions younger than this many seconds are used without any network call.
+# Older entries are revalidated with a conditional request (ETag / Last-Modified).
+PYPI_CACHE_TTL = 3600
 
-# The official PyPI JSON API endpoint for fetching package metadata.
-PYPI_JSON_URL = "https://pypi.org/pypi/{package_name}/json"
+# A global flag to enable or disable the on-disk PyPI cache.
+PYPI_CACHE_ENABLED = True
 
-# A global flag to enable or disable verbose debugging output for troubleshooting.
-DEBUG_MODE = False
+# The logger for path-resolution debugging output. Its messages are only emitted once
+# enabled with `set_debug_mode`, through the handlers configured by the calling script.
+_LOGGER = logging.getLogger(__name__)
+
+# Whether the TML heuristics may use the index of installed top-level names (see
+# `set_top_level_index`); off by default, as single lookups are faster without it.
+TOP_LEVEL_INDEX_ENABLED = False
 
 def set_debug_mode(enabled: bool):
     """
     Globally sets the debug mode for this module.
 
     Args:
-        enabled (bool): True to enable debug prints, False to disable.
+        enabled (bool): True to enable debug messages, False to disable.
+    """
+    _LOGGER.setLevel(logging.DEBUG if enabled else logging.NOTSET)
+
+def set_pypi_cache(enabled: bool, ttl: int = None):
+    """
+    Globally configures the on-disk PyPI version cache for this module.
+
+    Args:
+        enabled (bool): True to read and write the cache, False to always query PyPI.
+        ttl (int): The age in seconds below which a cached version is used as-is.
+                   The current TTL is kept if None.
+    """
+    global PYPI_CACHE_ENABLED, PYPI_CACHE_TTL  # pylint: disable=global-statement
+    PYPI_CACHE_ENABLED = enabled
+    if ttl is not None:
+        PYPI_CACHE_TTL = ttl
+    # Results memoized under the previous settings no longer apply.
+    _lookup_latest_version.cache_clear()
+
+def set_top_level_index(enabled: bool):
+    """
+    Globally allows the TML heuristics to consult an index of all installed top-level names.
+
+    Building the index walks every installed distribution once, which only pays off when
+    many packages are resolved in the same process (e.g. listing all packages).
+
+    Args:
+        enabled (bool): True to use the index, False to rely on the import system alone.
+    """
+    global TOP_LEVEL_INDEX_ENABLED  # pylint: disable=global-statement
+    TOP_LEVEL_INDEX_ENABLED = enabled
+    # Results memoized under the previous setting no longer apply.
+    _refine_top_level_module.cache_clear()
+
+# File extensions that mark a distribution as containing compiled (platform-specific) code.
+# Both cases are listed so that a single `str.endswith` call replaces suffix parsing and
+# case folding for every RECORD entry.
+_COMPILED_EXTENSIONS = ('.so', '.pyd', '.dll', '.dylib', '.SO', '.PYD', '.DLL', '.DYLIB')
+
+# Fields of `resolve_package_metadata` that are read from METADATA (None if summary_only).
+_VERBOSE_FIELDS = ("metadata_summary", "required_python_version", "license", "author",
+                   "homepage", "required_dependencies")
+
+# Suffixes of the per-distribution metadata folder.
+_METADATA_FOLDER_SUFFIXES = ('.dist-info', '.egg-info')
+
+# Translation table normalizing a distribution name towards its import name ('-' -> '_').
+_DASH_TO_UNDERSCORE = str.maketrans('-', '_')
+
+# Runs of separators collapsed by PEP 503 project-name normalization.
+_NAME_SEPARATORS_RE = re.compile(r'[-_.]+')
+
+# Known distributions whose top-level module cannot be derived from the distribution name,
+# keyed by normalized name. Needed for wheels that do not ship a `top_level.txt`.
+_PKG_TML_OVERRIDES = {
+    'beautifulsoup4': 'bs4',
+    'opencv_python': 'cv2',
+    'pillow': 'PIL',
+    'pyjwt': 'jwt',
+    'python_dateutil': 'dateutil',
+    'pyyaml': 'yaml',
+    'scikit_image': 'skimage',
+    'scikit_learn': 'sklearn',
+    'snowflake_connector_python': 'snowflake',
+}
+
+class _RootState(enum.Enum):
+    """
+    How far the distribution root could be determined from the distribution's file listing.
+
+    Each unresolved state's value is the message reported as the path when no later
+    resolution step succeeds.
+    """
+    RESOLVED = "Resolved from the distribution files."
+    NO_FILE_LISTING = "Could not determine root."
+    FILES_UNUSABLE = "Could not determine root via files."
+
+# ====================================================================
+# HTTP SESSION
+# ====================================================================
+
+def _build_session():
+    """
+    Builds the shared HTTP session used for all PyPI lookups.
+
+    A single session keeps the TLS connection to PyPI alive across lookups, so only the
+    first request pays for the handshake. Transient gateway errors are retried with a
+    short backoff; the final status is still returned to the caller for reporting.
+
+    Returns:
+        requests.Session: A session with a pooled, retrying adapter mounted on https://.
+
+    Raises:
+        ImportError: If the `requests` library is not installed.
+    """
+    # pylint: disable=import-outside-toplevel
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": PYPI_USER_AGENT, "Accept": "application/json"})
+    # Rate limiting (429, honoring Retry-After) and server errors are retried with an
+    # exponential backoff of roughly 0.3s, 0.6s and 1.2s.
+    retry_options = {'total': 3, 'backoff_factor': 0.3,
+                     'status_forcelist': (429, 500, 502, 503, 504), 'raise_on_status': False}
+    try:
+        # Jitter keeps the concurrent lookup workers from retrying in lockstep.
+        retries = Retry(backoff_jitter=0.1, **retry_options)
+    except TypeError:  # urllib3 < 2.0 has no backoff jitter.
+        retries = Retry(**retry_options)
+    # All lookups target a single host, so one pool holding one keep-alive connection per
+    # lookup worker is enough; concurrent lookups never wait for, or discard, a connection.
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=PYPI_MAX_WORKERS,
+                                          max_retries=retries))
+    atexit.register(session.close)
+    return session
+
+# The shared session, built on the first PyPI lookup: importing `requests` (urllib3, certifi,
+# charset_normalizer...) adds tens of milliseconds to start-up, which runs that only read
+# local metadata should not pay. False records that `requests` is not installed.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_session():
+    """
+    Returns the shared PyPI session, building it on first use.
+
+    Returns:
+        requests.Session: The shared session, or None if `requests` is not installed.
+    """
+    global _SESSION  # pylint: disable=global-statement
+    # Lookups run on several threads; the lock ensures only one session is ever built.
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            try:
+                _SESSION = _build_session()
+            except ImportError:
+                _SESSION = False
+    return _SESSION if _SESSION is not False else None
+
+# ====================================================================
+# PYPI RESPONSE CACHE
+# ====================================================================
+
+def _canonicalize_name(package_name: str) -> str:
+    """
+    Normalizes a project name as PyPI does (PEP 503), e.g., 'PyYAML' -> 'pyyaml'.
+
+    Requesting the canonical name directly avoids PyPI's redirect from other spellings,
+    which would cost an extra round trip.
+
+    Args:
+        package_name (str): The name of the package as it appears on PyPI.
+
+    Returns:
+        str: The lowercase name with runs of '-', '_' and '.' replaced by a single '-'.
+    """
+    return _NAME_SEPARATORS_RE.sub('-', package_name).lower()
+
+def _cache_file(package_name: str) -> Path:
+    """
+    Returns the cache file path for a package, keyed by its normalized PyPI name.
+
+    Args:
+        package_name (str): The name of the package as it appears on PyPI.
+
+    Returns:
+        Path: The path of the JSON cache entry for the package.
+    """
+    normalized_name = _canonicalize_name(package_name)
+    return PYPI_CACHE_DIR / f"{hashlib.sha1(normalized_name.encode('utf-8')).hexdigest()}.json"
+
+def _read_cache_entry(package_name: str):
+    """
+    Reads the cached PyPI entry of a package.
+
+    Args:
+        package_name (str): The name of the package as it appears on PyPI.
+
+    Returns:
+        tuple: The cached entry dictionary and its age in seconds, or (None, None) if the
+               entry is missing or unreadable.
+    """
+    cache_file = _cache_file(package_name)
+    try:
+        age = time.time() - cache_file.stat().st_mtime
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if isinstance(entry, dict) and entry.get('version'):
+            return entry, age
+    except (OSError, ValueError):
+        pass
+    return None, None
+
+def _write_cache_entry(package_name: str, entry: dict):
     """
-    global DEBUG_MODE  # pylint: disable=global-statement
-    DEBUG_MODE = enabled
+    Atomically writes the cached PyPI entry of a package. Failures are silently ignored,
+    as the cache is only an optimization.
+
+    Args:
+        package_name (str): The name of the package as it appears on PyPI.
+        entry (dict): The entry to store (version, etag, last_modified).
+    """
+    cache_file = _cache_file(package_name)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_file.parent,
+                                         suffix='.tmp', delete=False) as tmp:
+            json.dump(entry, tmp)
+        os.replace(tmp.name, cache_file)
+    except OSError:
+        pass
+
+def _touch_cache_entry(package_name: str):
+    """
+    Marks a cached PyPI entry as fresh after PyPI confirmed it is unchanged (HTTP 304).
+
+    Args:
+        package_name (str): The name of the package as it appears on PyPI.
+    """
+    try:
+        os.utime(_cache_file(package_name))
+    except OSError:
+        pass
 
 # ====================================================================
 # SHARED FUNCTIONS
 # ====================================================================
 
-def get_package_location_category(install_path):  # pylint: disable=too-many-return-statements,too-many-branches
+@functools.lru_cache(maxsize=1)
+def _location_roots() -> tuple:
+    """
+    Collects the resolved root directories used to categorize installation paths.
+
+    The environment variables and interpreter paths do not change during a run, so they are
+    read and resolved with `os.path.realpath` once rather than for every package.
+
+    Returns:
+        tuple: ('custom', roots), ('user', roots) and ('system', roots) pairs in precedence
+               order, each holding a tuple of real paths ready for `str.startswith`.
+    """
+    # 1. Custom: MODULEPATH (Priority 1), then PYTHONPATH (Priority 2)
+    custom_roots = [os.path.realpath(path)
+                    for env_var in ('MODULEPATH', 'PYTHONPATH')
+                    for path in os.environ.get(env_var, '').split(os.pathsep) if path]
+
+    # 2. User: the user's home directory site packages
+    try:
+        user_site = site.getusersitepackages()
+        user_paths = [user_site] if isinstance(user_site, str) else (user_site if user_site else [])
+        user_roots = [os.path.realpath(path) for path in user_paths]
+    except (AttributeError, TypeError):
+        # Fallback to home dir check if site.getusersitepackages is problematic
+        user_roots = [os.path.expanduser('~')]
+
+    # 3. System: the virtual environment (treated as system/standard for this env), then
+    # site.getsitepackages(), then any 'site-packages' entry of sys.path as a fallback
+    system_roots = []
+    if (hasattr(sys, 'real_prefix') or
+            (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)):
+        system_roots.append(os.path.realpath(sys.prefix))
+    try:
+        system_roots.extend(os.path.realpath(path) for path in site.getsitepackages())
+    except (AttributeError, TypeError):
+        pass
+    system_roots.extend(os.path.realpath(path) for path in sys.path
+                        if path and ('site-packages' in path or 'dist-packages' in path))
+
+    return (("custom", tuple(custom_roots)), ("user", tuple(user_roots)),
+            ("system", tuple(system_roots)))
+
+def get_package_location_category(install_path):
     """
     Categorizes a package's installation path into 'user', 'system', or 'custom'.
 
@@ -96,60 +403,115 @@ def get_package_location_category(install_path):  # pylint: disable=too-many-ret
     if not install_path or not os.path.exists(install_path):
         return "unknown"
 
+    # One `startswith` call per category tests all of its roots at C level. The categories are
+    # checked in precedence order (not longest prefix first), so that e.g. a PYTHONPATH entry
+    # above site-packages still marks the package as custom.
     real_install_path = os.path.realpath(install_path)
+    for category, roots in _location_roots():
+        if real_install_path.startswith(roots):
+            return category
 
-    # 1. Custom: Check MODULEPATH (Priority 1)
-    module_path_env = os.environ.get('MODULEPATH')
-    if module_path_env:
-        for path in module_path_env.split(os.pathsep):
-            if path and real_install_path.startswith(os.path.realpath(path)):
-                return "custom"
-
-    # 2. Custom: Check PYTHONPATH (Priority 2)
-    pythonpath = os.environ.get('PYTHONPATH')
-    if pythonpath:
-        for path in pythonpath.split(os.pathsep):
-            if path and real_install_path.startswith(os.path.realpath(path)):
-                return "custom"
-
-    # 3. User: Check user's home directory site packages
-    try:
-        user_site = site.getusersitepackages()
-        user_paths = [user_site] if isinstance(user_site, str) else (user_site if user_site else [])
-        for path in user_paths:
-            if real_install_path.startswith(os.path.realpath(path)):
-                return "user"
-    except (AttributeError, TypeError):
-        # Fallback to home dir check if site.getusersitepackages is problematic
-        home_dir = os.path.expanduser('~')
-        if real_install_path.startswith(home_dir):
-            return "user"
+    return "unknown"
 
-    # 4. System: Check Virtual Environment (Treat as system/standard for this env)
-    if (hasattr(sys, 'real_prefix') or
-            (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)):
-        if real_install_path.startswith(os.path.realpath(sys.prefix)):
-            return "system"
+def _conditional_headers(cache_entry) -> dict:
+    """
+    Builds the revalidation headers for a stale cache entry.
 
-    # 5. System: Check site.getsitepackages()
-    try:
-        for path in site.getsitepackages():
-            if real_install_path.startswith(os.path.realpath(path)):
-                return "system"
-    except (AttributeError, TypeError):
-        pass
+    Args:
+        cache_entry (dict): The cached lookup, or None.
 
-    # 6. System: Check sys.path fallback for 'site-packages'
-    for path in sys.path:
-        if path and ('site-packages' in path or 'dist-packages' in path):
-            if real_install_path.startswith(os.path.realpath(path)):
-                return "system"
+    Returns:
+        dict: 'If-None-Match' / 'If-Modified-Since' headers for the validators on record.
+    """
+    headers = {}
+    if cache_entry:
+        if cache_entry.get('etag'):
+            headers['If-None-Match'] = cache_entry['etag']
+        if cache_entry.get('last_modified'):
+            headers['If-Modified-Since'] = cache_entry['last_modified']
+    return headers
+
+def _latest_from_json_api(response) -> str:
+    """
+    Extracts the latest version from a PyPI JSON API response.
 
-    return "unknown"
+    Args:
+        response (requests.Response): A successful response from the PyPI JSON API.
+
+    Returns:
+        str: The version PyPI reports as the latest release.
+    """
+    return response.json()['info']['version']
+
+def _yanked_versions(files) -> set:
+    """
+    Finds the versions whose files are all yanked (PEP 592) in a PyPI Simple API file list,
+    since its PEP 700 version list still includes them. File names are only parsed when some
+    file is yanked; names that cannot be parsed (e.g., legacy '.egg' uploads) are ignored.
+
+    Args:
+        files (list): The 'files' entries of a Simple API response.
+
+    Returns:
+        set: The yanked versions, as `packaging.version.Version` objects.
+    """
+    if not any(file.get('yanked') for file in files):
+        return set()
+    yanked, available = set(), set()
+    for file in files:
+        filename = file.get('filename', '')
+        parse = parse_wheel_filename if filename.endswith('.whl') else parse_sdist_filename
+        try:
+            version = parse(filename)[1]
+        except (InvalidWheelFilename, InvalidSdistFilename, InvalidVersion):
+            continue
+        (yanked if file.get('yanked') else available).add(version)
+    return yanked - available
+
+def _latest_from_simple_index(response):
+    """
+    Picks the latest version that is not yanked from a PyPI Simple API response: the highest
+    final release, or the highest pre-release if the project has no final release.
+
+    Args:
+        response (requests.Response): A successful response from the PyPI Simple API.
+
+    Returns:
+        str: The latest version as published, or None if the response is not a JSON
+             Simple API page listing versions.
+    """
+    if not response.headers.get('Content-Type', '').startswith(PYPI_SIMPLE_CONTENT_TYPE):
+        return None
+
+    index = response.json()
+    yanked = _yanked_versions(index.get('files') or ())
+    parsed_versions = []
+    for raw_version in index.get('versions') or ():
+        try:
+            parsed_versions.append((Version(raw_version), raw_version))
+        except InvalidVersion:
+            pass
+    parsed_versions = [pair for pair in parsed_versions if pair[0] not in yanked]
+    if not parsed_versions:
+        return None
+
+    final_releases = [pair for pair in parsed_versions if not pair[0].is_prerelease]
+    return max(final_releases or parsed_versions)[1]
 
 def get_latest_version_from_pypi(package_name: str) -> str:
     """
-    Fetches the latest published version of a package from the PyPI JSON API.
+    Fetches the latest published version of a package from PyPI.
+
+    When the `packaging` library is available, the compact PyPI Simple API (PEP 691) is
+    queried first; the JSON API is used as a fallback, or directly otherwise.
+
+    Successful lookups are cached on disk (see `PYPI_CACHE_DIR`). A cache entry younger
+    than `PYPI_CACHE_TTL` is returned without any network call; an older one is revalidated
+    with a conditional request, so an unchanged package costs a body-less HTTP 304. If PyPI
+    cannot be reached or answers with an error, a stale cache entry is returned instead.
+
+    Within a process, each project is looked up at most once: spellings that normalize to
+    the same name (e.g., 'Flask' and 'flask') share the result.
 
     Args:
         package_name (str): The name of the package as it appears on PyPI.
@@ -157,52 +519,325 @@ def get_latest_version_from_pypi(package_name: str) -> str:
     Returns:
         str: The latest version number as a string, or an error message if the lookup fails.
     """
+    return _lookup_latest_version(_canonicalize_name(package_name))
+
+@functools.lru_cache(maxsize=512)
+def _lookup_latest_version(project: str) -> str:  # pylint: disable=too-many-return-statements
+    """
+    Performs the cached or network lookup behind `get_latest_version_from_pypi`.
+
+    Args:
+        project (str): The canonical (PEP 503) project name.
+
+    Returns:
+        str: The latest version number as a string, or an error message if the lookup fails.
+    """
+    cache_entry, cache_age = (_read_cache_entry(project) if PYPI_CACHE_ENABLED
+                              else (None, None))
+    if cache_entry and cache_age < PYPI_CACHE_TTL:
+        return cache_entry['version']
+
     # Return an error immediately if the `requests` library is not available.
-    if isinstance(requests, DummyRequests):
+    session = _get_session()
+    if session is None:
         return "Error: requests library not found for network lookup"
+    # Already loaded by _get_session(), so this is only a sys.modules lookup.
+    from requests.exceptions import RequestException  # pylint: disable=import-outside-toplevel
+
+    endpoints = ([(f"{PYPI_SIMPLE_URL_PREFIX}{project}/", PYPI_SIMPLE_CONTENT_TYPE,
+                   _latest_from_simple_index)] if HAS_PACKAGING else [])
+    endpoints.append((f"{PYPI_JSON_URL_PREFIX}{project}/json", 'application/json',
+                      _latest_from_json_api))
 
     try:
-        url = PYPI_JSON_URL.format(package_name=package_name)
-        response = requests.get(url, timeout=5)
+        headers = _conditional_headers(cache_entry)
+        for url, accept, extract_latest in endpoints:
+            response = session.get(url, timeout=PYPI_TIMEOUT,
+                                   headers={**headers, 'Accept': accept})
+
+            if response.status_code == 304 and cache_entry:
+                _touch_cache_entry(project)
+                return cache_entry['version']
+            if response.status_code == 404:
+                return "Package not found on PyPI"
+            if response.status_code == 200:
+                latest_version = extract_latest(response)
+                if latest_version:
+                    if PYPI_CACHE_ENABLED:
+                        _write_cache_entry(project, {
+                            'version': latest_version,
+                            'etag': response.headers.get('ETag'),
+                            'last_modified': response.headers.get('Last-Modified'),
+                        })
+                    return latest_version
+            # Otherwise (e.g., 406 Not Acceptable), fall back to the next endpoint.
+
+        # A stale version is more useful than an error (e.g., during a PyPI outage).
+        return cache_entry['version'] if cache_entry else f"Error: HTTP {response.status_code}"
+
+    except RequestException:
+        return cache_entry['version'] if cache_entry else "Error: Network failure"
+    except Exception:  # pylint: disable=broad-exception-caught
+        return "Error: Metadata parsing failure"
+
+def iter_latest_versions(package_names, max_workers: int = PYPI_MAX_WORKERS):
+    """
+    Fetches the latest published versions of several packages from PyPI concurrently,
+    yielding each result as soon as it (and every result before it) is available.
 
-        if response.status_code == 200:
-            data = response.json()
-            return data['info']['version']
-        if response.status_code == 404:
-            return "Package not found on PyPI"
+    The lookups are network-bound and independent, so they are spread over a small thread
+    pool sharing the module's HTTP session (whose connection pool is thread-safe).
 
-        return f"Error: HTTP {response.status_code}"
+    Args:
+        package_names (iterable): The names of the packages as they appear on PyPI.
+        max_workers (int): The maximum number of concurrent lookups.
 
-    except requests.exceptions.RequestException:
-        return "Error: Network failure"
-    except Exception:  # pylint: disable=broad-exception-caught
-        return "Error: Metadata parsing failure"
+    Yields:
+        tuple: Each unique package name with its latest version or error message, in input
+               order (other spellings of a project follow its first occurrence).
+    """
+    unique_names = list(dict.fromkeys(package_names))
+    if not unique_names:
+        return
+
+    # Spellings of the same project (e.g., 'Flask' and 'flask') are looked up only once.
+    names_by_project = {}
+    for name in unique_names:
+        names_by_project.setdefault(_canonicalize_name(name), []).append(name)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(names_by_project))) as executor:
+        for project, version in zip(names_by_project,
+                                    executor.map(_lookup_latest_version, names_by_project)):
+            for name in names_by_project[project]:
+                yield name, version
+
+def fetch_latest_versions(package_names, max_workers: int = PYPI_MAX_WORKERS) -> dict:
+    """
+    Fetches the latest published versions of several packages from PyPI concurrently.
+
+    Args:
+        package_names (iterable): The names of the packages as they appear on PyPI.
+        max_workers (int): The maximum number of concurrent lookups.
 
-def get_module_type(dist: importlib.metadata.Distribution) -> str:
+    Returns:
+        dict: A mapping of each package name to its latest version or error message.
     """
-    Determines if a package is 'purelib' (pure Python) or 'platlib' (contains compiled binaries).
+    return dict(iter_latest_versions(package_names, max_workers))
+
+# Leading numeric release segment of a version string (e.g., '2.31.0' in '2.31.0.post1'),
+# used to compare versions when the `packaging` library is not installed.
+_RELEASE_RE = re.compile(r'\d+(?:\.\d+)*')
 
-    This function inspects the file list of an installed package for common compiled file extensions
-    (e.g., .so, .pyd) to differentiate between pure Python and platform-specific distributions.
+def _release_tuple(version: str):
+    """
+    Extracts the numeric release segment of a version as a comparable tuple.
 
     Args:
-        dist (importlib.metadata.Distribution): The distribution object for the package.
+        version (str): A version string, e.g., '2.31.0rc1'.
 
     Returns:
-        str: A string indicating the module type, e.g., "purelib" or "platlib".
+        tuple: The release numbers without trailing zeros (so '1.0' equals '1.0.0'), or None
+               if the string does not start with a release number.
     """
-    compiled_extensions = ('.so', '.pyd', '.dll', '.dylib')
+    match = _RELEASE_RE.match(version)
+    if not match:
+        return None
+    release = [int(part) for part in match.group().split('.')]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+    return tuple(release)
+
+def is_newer_version(candidate: str, current: str) -> bool:
+    """
+    Tells whether a version is strictly newer than another.
 
-    if dist.files is None:
-        return "Type Unknown (No File Listing)"
+    Versions are compared per PEP 440 when the `packaging` library is available; otherwise
+    only their numeric release segments are compared, ignoring pre/post/dev suffixes.
+
+    Args:
+        candidate (str): The version that may be newer, e.g., the latest on PyPI.
+        current (str): The reference version, e.g., the installed one.
+
+    Returns:
+        bool: True if `candidate` is newer. False if it is not, or if either string is not a
+              version (such as an error message returned by a PyPI lookup).
+    """
+    if HAS_PACKAGING:
+        try:
+            return Version(candidate) > Version(current)
+        except InvalidVersion:
+            return False
+    candidate_release, current_release = _release_tuple(candidate), _release_tuple(current)
+    if candidate_release is None or current_release is None:
+        return False
+    return candidate_release > current_release
+
+def _is_pure_python_wheel(dist) -> bool:
+    """
+    Checks the WHEEL metadata file for proof that a distribution is pure Python.
+
+    Args:
+        dist (importlib.metadata.Distribution): The installed distribution.
+
+    Returns:
+        bool: True if the wheel declares 'Root-Is-Purelib: true' and only platform-independent
+              ('*-none-any') tags; False if it does not, or has no WHEEL file.
+    """
+    wheel_text = dist.read_text('WHEEL')
+    if not wheel_text:
+        return False
+
+    root_is_purelib = False
+    tags = []
+    for line in wheel_text.splitlines():
+        key, _, value = line.partition(':')
+        key, value = key.strip().lower(), value.strip()
+        if key == 'root-is-purelib':
+            root_is_purelib = value.lower() == 'true'
+        elif key == 'tag':
+            tags.append(value)
+    return root_is_purelib and bool(tags) and all(tag.endswith('-none-any') for tag in tags)
+
+def _scan_distribution_files(files, known_pure: bool = False) -> tuple:
+    """
+    Scans a distribution's file list once to find its metadata folder and compiled files.
 
-    for file in dist.files:
-        if Path(str(file)).suffix.lower() in compiled_extensions:
-            return "platlib (Binary/Compiled C/C++)"
+    Both facts are gathered in a single pass, which stops as soon as both are known; for
+    large distributions (thousands of RECORD entries) this is the dominant local CPU cost.
 
+    Args:
+        files (list): The `PackagePath` entries from `Distribution.files`, or None.
+        known_pure (bool): True if the WHEEL metadata already proves the distribution has no
+                           compiled files; only the metadata folder is then searched for.
+
+    Returns:
+        tuple: The name of the `.dist-info`/`.egg-info` folder (or None if not listed), and
+               whether a compiled extension was found (None if there is no file listing and
+               the wheel is not known to be pure).
+    """
+    if files is None:
+        return None, (False if known_pure else None)
+
+    dist_info_folder_name = None
+    # A pure wheel is treated as if its compiled file had already been found.
+    has_compiled_files = known_pure
+    for file in files:
+        if dist_info_folder_name is None and file.parts[0].endswith(_METADATA_FOLDER_SUFFIXES):
+            dist_info_folder_name = file.parts[0]
+        if not has_compiled_files and file.name.endswith(_COMPILED_EXTENSIONS):
+            has_compiled_files = True
+        if has_compiled_files and dist_info_folder_name is not None:
+            break
+
+    return dist_info_folder_name, has_compiled_files and not known_pure
+
+def _version_from_metadata_folder(folder_name):
+    """
+    Reads the version encoded in a '<name>-<version>.dist-info' folder name.
+
+    Args:
+        folder_name (str): The metadata folder name, as found by `_scan_distribution_files`.
+
+    Returns:
+        str: The version, or None for '.egg-info' folders (whose names may omit it), unlisted
+             folders, and escaped versions ('_' stands for a character that was replaced).
+    """
+    if not folder_name or not folder_name.endswith('.dist-info'):
+        return None
+    _, separator, version = folder_name[:-len('.dist-info')].partition('-')
+    return version if separator and version and '_' not in version else None
+
+def get_distribution_name(dist) -> str:
+    """
+    Reads a distribution's project name from the header of its METADATA (or PKG-INFO) file.
+
+    Only the 'Name:' header line is looked for, so the email parser behind `dist.metadata` is
+    not run; on a large environment this parsing dominates the cost of listing packages.
+
+    Args:
+        dist (importlib.metadata.Distribution): The distribution.
+
+    Returns:
+        str: The project name as spelled in its metadata, or None if it has none.
+    """
+    text = dist.read_text('METADATA') or dist.read_text('PKG-INFO')
+    if text:
+        # Headers end at the first blank line; the (possibly long) description follows it.
+        for line in text.partition('\n\n')[0].splitlines():
+            if line[:5].lower() == 'name:':
+                return line[5:].strip()
+    return dist.metadata['name']
+
+def get_module_type(has_compiled_files) -> str:
+    """
+    Describes a package as 'purelib' (pure Python) or 'platlib' (contains compiled binaries).
+
+    Args:
+        has_compiled_files (bool): Whether the package's file list contains compiled
+                                   extensions (e.g., .so, .pyd), as found by
+                                   `_scan_distribution_files`; None if the distribution has
+                                   no file listing.
+
+    Returns:
+        str: A string indicating the module type, e.g., "purelib" or "platlib".
+    """
+    if has_compiled_files is None:
+        return "Type Unknown (No File Listing)"
+    if has_compiled_files:
+        return "platlib (Binary/Compiled C/C++)"
     return "purelib (Pure Python code)"
 
-def resolve_package_metadata(package_name: str) -> dict:  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+@functools.lru_cache(maxsize=1)
+def _installed_top_level_names():
+    """
+    Lists the top-level import names provided by all installed distributions.
+
+    `packages_distributions()` walks every distribution once; caching its keys lets the TML
+    heuristics rule out names that no distribution provides without probing the import system.
+
+    Returns:
+        frozenset: The top-level names, or None on Python < 3.10 (where
+                   `packages_distributions` is unavailable).
+    """
+    if not hasattr(importlib.metadata, 'packages_distributions'):
+        return None
+    return frozenset(importlib.metadata.packages_distributions())
+
+@functools.lru_cache(maxsize=256)
+def _refine_top_level_module(package_name_normalized: str, raw_tml: str) -> str:
+    """
+    Applies the TML heuristics to pick the importable top-level module of a package.
+
+    The result only depends on the inputs and on the import system, so it is cached; this
+    avoids repeating the (potentially slow) `find_spec` probe for the same package. When the
+    top-level index is enabled, names that no installed distribution provides are rejected
+    without probing.
+
+    Args:
+        package_name_normalized (str): The lowercase package name with '-' replaced by '_'.
+        raw_tml (str): The first entry of `top_level.txt`, or the normalized name if absent.
+
+    Returns:
+        str: The name of the top-level module.
+    """
+    if not raw_tml:
+        return package_name_normalized
+    if raw_tml.startswith('_') and raw_tml != package_name_normalized:
+        return package_name_normalized
+    if (package_name_normalized.startswith(raw_tml) and
+            len(package_name_normalized) > len(raw_tml)):
+        return raw_tml
+    # The index is only a negative filter: its keys come from the same top_level.txt/RECORD
+    # data being validated, so a listed name must still be confirmed by the import system.
+    top_level_names = _installed_top_level_names() if TOP_LEVEL_INDEX_ENABLED else None
+    if top_level_names is not None and raw_tml not in top_level_names:
+        return package_name_normalized
+    if not importlib.util.find_spec(raw_tml):
+        return package_name_normalized
+    return raw_tml
+
+def resolve_package_metadata(package_name: str, fetch_latest: bool = True, dist=None,  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+                             summary_only: bool = False) -> dict:
     """
     Resolves a comprehensive set of metadata for a given installed package.
 
@@ -213,123 +848,136 @@ def resolve_package_metadata(package_name: str) -> dict:  # pylint: disable=too-
 
     Args:
         package_name (str): The name of the package to resolve.
+        fetch_latest (bool): If False, skip the PyPI lookup and leave `latest_version` as
+                             None so that the caller can fill it in (e.g., in a batch).
+        dist (importlib.metadata.Distribution): The distribution, if the caller already has
+                                                it (e.g., from `distributions()`); otherwise
+                                                it is looked up by name, scanning `sys.path`.
+        summary_only (bool): If True, METADATA is not parsed: the version is read from the
+                             '.dist-info' folder name when possible, and the verbose fields
+                             (summary, license, author...) are returned as None.
 
     Returns:
         dict: A dictionary containing detailed metadata, or an error dictionary if the package
               is not found.
     """
-    global DEBUG_MODE  # pylint: disable=global-variable-not-assigned
-
-    if DEBUG_MODE:
-        print("\n--- DEBUG: Path Resolution Start ---")
-
-    if sys.version_info < MIN_PYTHON_VERSION_TUPLE:
-        return {"error": (f"Python {MIN_PYTHON_VERSION_TUPLE[0]}.{MIN_PYTHON_VERSION_TUPLE[1]} "
-                          "or newer required for metadata handling.")}
+    # Debug messages use lazy %-formatting, so nothing is formatted unless debugging is on.
+    _LOGGER.debug("\n--- DEBUG: Path Resolution Start ---")
 
     # --- 1. Get Distribution Metadata ---
     try:
-        dist = importlib.metadata.distribution(package_name)
-        current_version = dist.version
-        metadata_dict = dist.metadata
+        if dist is None:
+            dist = importlib.metadata.distribution(package_name)
 
     except importlib.metadata.PackageNotFoundError:
         return {"error": f"Package '{package_name}' not found."}
 
     # --- 2. Determine Top-Level Module (TML) ---
-    top_level_text = dist.read_text('top_level.txt')
+    package_name_normalized = package_name.lower().translate(_DASH_TO_UNDERSCORE)
+    top_level_module = _PKG_TML_OVERRIDES.get(package_name_normalized)
 
-    if top_level_text:
+    if top_level_module is None:
+        top_level_text = dist.read_text('top_level.txt')
         # Use the first line as the primary TML.
-        raw_tml = top_level_text.splitlines()[0].strip()
-    else:
-        raw_tml = package_name.lower().replace('-', '_')
-
-    # --- 2a. TML Heuristic Refinement ---
-    package_name_normalized = package_name.lower().replace('-', '_')
-    top_level_module = raw_tml
-
-    if not top_level_module:
-        top_level_module = package_name_normalized
-    elif top_level_module.startswith('_') and top_level_module != package_name_normalized:
-        top_level_module = package_name_normalized
-    elif (package_name_normalized.startswith(top_level_module) and
-          len(package_name_normalized) > len(top_level_module)):
-        pass
-    else:
-        if not top_level_module or not importlib.util.find_spec(top_level_module):
-            top_level_module = package_name_normalized
+        raw_tml = (top_level_text.splitlines()[0].strip() if top_level_text
+                   else package_name_normalized)
+        top_level_module = _refine_top_level_module(package_name_normalized, raw_tml)
 
     # --- 3. Determine Installation Root (dist_root) ---
-    dist_root = "Could not determine root."
+    root_state, dist_root = _RootState.NO_FILE_LISTING, None
+    files = dist.files
+    dist_info_folder_name, has_compiled_files = _scan_distribution_files(
+        files, known_pure=_is_pure_python_wheel(dist))
+
+    # Both `dist.version` and `dist.metadata` parse METADATA from disk on every access.
+    current_version = ((summary_only and _version_from_metadata_folder(dist_info_folder_name))
+                       or dist.version)
 
     try:
-        if dist.files:
-            dist_info_folder_name = [
-                str(f).split(os.sep, maxsplit=1)[0]
-                for f in dist.files
-                if str(f).endswith('.dist-info') or str(f).endswith('.egg-info')
-            ][0]
-            dist_root = str(Path(os.path.abspath(str(dist.locate_file(
-                Path(dist_info_folder_name))))).parent)
+        if files:
+            if dist_info_folder_name is None:
+                raise LookupError("No metadata folder listed in the distribution files.")
+            dist_root = os.path.dirname(os.path.abspath(dist.locate_file(dist_info_folder_name)))
+            root_state = _RootState.RESOLVED
     except Exception:  # pylint: disable=broad-exception-caught
-        dist_root = "Could not determine root via files."
+        root_state = _RootState.FILES_UNUSABLE
 
-    if DEBUG_MODE:
-        print(f"DEBUG 1: Top-Level Module (TML): {top_level_module}")
-        print(f"DEBUG 1: Distribution Root (Calculated): {dist_root}")
+    _LOGGER.debug("DEBUG 1: Top-Level Module (TML): %s", top_level_module)
+    _LOGGER.debug("DEBUG 1: Distribution Root (Calculated): %s", dist_root or root_state.value)
 
     # --- 4. Locate the installation folder (FINAL PATH LOGIC) ---
-    resolved_path = "Could not resolve path."
+    resolved_path = None
+    dist_root_is_dir = root_state is _RootState.RESOLVED and Path(dist_root).is_dir()
 
-    if dist_root != "Could not determine root." and Path(dist_root).is_dir():
+    if dist_root_is_dir:
         potential_path = Path(dist_root) / top_level_module
-        if DEBUG_MODE:
-            print(f"DEBUG 2: Constructed Module Path: {potential_path}")
-            print(f"DEBUG 2: Constructed Path Exists?: {potential_path.is_dir()}")
+        potential_path_exists = potential_path.is_dir()
+        _LOGGER.debug("DEBUG 2: Constructed Module Path: %s", potential_path)
+        _LOGGER.debug("DEBUG 2: Constructed Path Exists?: %s", potential_path_exists)
 
-        if potential_path.is_dir():
+        if potential_path_exists:
             resolved_path = str(potential_path)
-        else:
-            resolved_path = "Falling through to find_spec."
 
-    if resolved_path in ("Could not resolve path.", "Falling through to find_spec."):
+    # Fall through to the import system only if the constructed path did not resolve.
+    if resolved_path is None:
         try:
-            spec = importlib.util.find_spec(top_level_module)
+            # Search dist_root first: unlike a global find_spec, this never imports parent
+            # packages as a side effect.
+            spec = (importlib.machinery.PathFinder.find_spec(top_level_module, [dist_root])
+                    if dist_root_is_dir else None)
+            if spec is None:
+                spec = importlib.util.find_spec(top_level_module)
 
             if spec and spec.submodule_search_locations:
                 resolved_path = spec.submodule_search_locations[0]
             elif spec and spec.origin:
                 resolved_path = os.path.dirname(spec.origin)
-            else:
-                resolved_path = dist_root
         except ImportError:
-            resolved_path = dist_root
+            pass
 
     # --- 4a. Path Resolution Final Fallback ---
-    if resolved_path == "Could not determine root via files.":
+    if resolved_path is None and root_state is _RootState.FILES_UNUSABLE:
         try:
-            potential_root_path = str(Path(os.path.abspath(str(dist.locate_file(
-                Path(top_level_module))))).parent)
+            potential_root_path = os.path.dirname(os.path.abspath(
+                dist.locate_file(top_level_module)))
             if Path(potential_root_path).is_dir():
                 resolved_path = potential_root_path
         except Exception as e:  # pylint: disable=broad-exception-caught
             resolved_path = (f"Could not determine root via locate_file: "
                              f"{str(e)}")
 
-    if DEBUG_MODE:
-        print(f"DEBUG FINAL: Resolved Path Before Return: {resolved_path}")
-        print("--- DEBUG: Path Resolution End ---\n")
+    if resolved_path is None:
+        resolved_path = dist_root if root_state is _RootState.RESOLVED else root_state.value
+
+    _LOGGER.debug("DEBUG FINAL: Resolved Path Before Return: %s", resolved_path)
+    _LOGGER.debug("--- DEBUG: Path Resolution End ---\n")
 
     # --- 5. Gather Remaining Metadata ---
-    latest_version = get_latest_version_from_pypi(package_name)
-    module_type = get_module_type(dist)
+    latest_version = get_latest_version_from_pypi(package_name) if fetch_latest else None
+    module_type = get_module_type(has_compiled_files)
     location_category = get_package_location_category(resolved_path)
 
-    requires_dist = metadata_dict.get('Requires-Dist')
-
-    # Process License: Truncate at first newline or 65 chars
-    raw_license = metadata_dict.get('License', metadata_dict.get('Classifier', 'N/A'))
+    result = {
+        "package_name": package_name,
+        "import_name": top_level_module,
+        "exact_path": resolved_path,
+        "current_version": current_version,
+        "latest_version": latest_version,
+        "module_type": module_type,
+        "location_category": location_category,
+    }
+    if summary_only:
+        result.update(dict.fromkeys(_VERBOSE_FIELDS))
+        return result
+
+    # Each metadata lookup scans the message headers, so every field is read exactly once.
+    m_get = dist.metadata.get
+
+    # Process License: Truncate at first newline or 65 chars. The Classifier fallback is only
+    # looked up when there is no License field.
+    raw_license = m_get('License')
+    if raw_license is None:
+        raw_license = m_get('Classifier', 'N/A')
     if raw_license and raw_license != 'N/A':
         first_line = str(raw_license).split('\n', maxsplit=1)[0]
         if len(first_line) > 65:
@@ -339,21 +987,14 @@ def resolve_package_metadata(package_name: str) -> dict:  # pylint: disable=too-
     else:
         license_text = 'N/A'
 
-    return {
-        "package_name": package_name,
-        "import_name": top_level_module,
-        "exact_path": resolved_path,
-        "current_version": current_version,
-        "latest_version": latest_version,
-        "module_type": module_type,
-        "location_category": location_category,
-
-        # Verbose/Additional Fields
-        "metadata_summary": metadata_dict.get('Summary', 'N/A'),
-        "required_python_version": metadata_dict.get('Requires-Python', 'N/A'),
+    # Verbose/Additional Fields
+    result.update({
+        "metadata_summary": m_get('Summary', 'N/A'),
+        "required_python_version": m_get('Requires-Python', 'N/A'),
         "license": license_text,
-        "author": metadata_dict.get('Author', 'N/A'),
-        "homepage": metadata_dict.get('Home-page', 'N/A'),
-        "required_dependencies": (requires_dist if isinstance(requires_dist, list)
-                                  else ([requires_dist] if requires_dist else []))
-    }
+        "author": m_get('Author', 'N/A'),
+        "homepage": m_get('Home-page', 'N/A'),
+        # `Distribution.requires` lists every Requires-Dist entry (`.get` only returns the first).
+        "required_dependencies": dist.requires or []
+    })
+    return result
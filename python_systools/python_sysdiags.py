@@ -34,21 +34,36 @@ Required: Ensure that the following environment variables are UNSET
           in the shell *before* executing this script:
           PYTHONPATH, PYTHONHOME, PYTHON, PYTHON_PLATFORM
           (e.g., `unset PYTHONPATH`)
+          If any of them is set, the script re-executes itself without them.
 """
 
-import ssl
+import os
 import sys
-import hashlib
-import sysconfig
-import importlib.util  # For checking module presence
-import argparse  # For command-line argument parsing
-import math  # Added for the math module check
-import json
-
-try:
-    import resource  # Unix-like systems only
-except ImportError:
-    resource = None  # Will be None on Windows
+import importlib.machinery  # For checking module presence
+
+# The modules behind each check (ssl, hashlib, math, resource, sysconfig), and the JSON
+# serializers, are imported by the functions that use them, so that running only some
+# sections (or only the text report) does not pay for the others; ssl alone pulls in _ssl,
+# socket and base64.
+
+# Standard library C extensions whose absence usually means a development library was
+# missing when the interpreter was built.
+_C_EXTENSIONS_TO_CHECK = (
+    'zlib', '_bz2', '_lzma', '_sqlite3', '_curses', '_gdbm', '_json',
+    '_socket', '_io', '_datetime', '_csv', '_elementtree',
+    '_collections', '_thread', '_multiprocessing', '_zstd'
+)
+
+# Bytes per gigabyte (GiB), used to report the address space limit.
+_GB = 1 << 30
+
+# Resource limits to report, as (resource module constant, result key) pairs. The constants
+# themselves are resolved when the check runs, since `resource` is only imported then.
+_RLIMIT_NAMES = (
+    ('RLIMIT_NOFILE', 'max_open_files'),
+    ('RLIMIT_AS', 'address_space_gb'),
+    ('RLIMIT_NPROC', 'max_processes')
+)
 
 # ----------------------------------------
 # Core Analysis Logic
@@ -58,15 +73,23 @@ class SystemDiagnostics:
     Encapsulates all system diagnostic checks.
     Each method returns structured data, separating data gathering from presentation.
     """
+    def __init__(self):
+        # `sys.flags` cannot change during the process lifetime, so the flags that are set
+        # (non-zero) are collected once. Its fields are enumerated through dir(), since some
+        # of them (e.g. 'gil' on 3.13) are not part of the sequence, skipping the counters
+        # ('n_fields', ...) and the tuple methods ('count', 'index').
+        self._interpreter_flags = {}
+        for flag_name in dir(sys.flags):
+            if flag_name.startswith(('_', 'n_')) or flag_name in ('count', 'index'):
+                continue
+            value = getattr(sys.flags, flag_name)
+            if value is True or (isinstance(value, int) and value != 0) or isinstance(
+                    value, str):
+                self._interpreter_flags[flag_name] = value
+
     def get_python_env_details(self):
         """Gathers Python Interpreter & Environment details."""
-        flags = {}
-        for flag_name in dir(sys.flags):
-            if not flag_name.startswith('_'):
-                value = getattr(sys.flags, flag_name)
-                if value is True or (isinstance(value, int) and value != 0) or isinstance(
-                        value, str):
-                    flags[flag_name] = value
+        import sysconfig  # pylint: disable=import-outside-toplevel
         return {
             "executable": sys.executable,
             "version": sys.version,
@@ -75,11 +98,13 @@ class SystemDiagnostics:
             "platform": sys.platform,
             "default_encoding": sys.getdefaultencoding(),
             "filesystem_encoding": sys.getfilesystemencoding(),
-            "interpreter_flags": flags
+            "interpreter_flags": dict(self._interpreter_flags)
         }
 
     def get_python_build_config(self):
         """Gathers Python Build-Time Configuration."""
+        import sysconfig  # pylint: disable=import-outside-toplevel
+
         config_vars = sysconfig.get_config_vars()
         return {
             "compiler": config_vars.get('CC', 'N/A'),
@@ -98,17 +123,16 @@ class SystemDiagnostics:
     def get_stdlib_c_extensions_check(self):
         """Checks status of Key Standard Library C-Extensions."""
         results = {}
-        c_extensions_to_check = [
-            'zlib', '_bz2', '_lzma', '_sqlite3', '_curses', '_gdbm', '_json',
-            '_socket', '_io', '_datetime', '_csv', '_elementtree',
-            '_collections', '_thread', '_multiprocessing', '_zstd'
-        ]
-        for module_name in c_extensions_to_check:
-            spec = importlib.util.find_spec(module_name)
-            if spec and spec.origin != 'built-in':
-                results[module_name] = {"status": "Found", "origin": spec.origin}
-            elif spec:
+        for module_name in _C_EXTENSIONS_TO_CHECK:
+            # Modules compiled into the interpreter are known without searching for them.
+            if module_name in sys.builtin_module_names:
                 results[module_name] = {"status": "Found", "origin": "built-in"}
+                continue
+            # The remaining ones can only be shared libraries on sys.path, so the path-based
+            # finder is queried directly rather than through the whole meta path.
+            spec = importlib.machinery.PathFinder.find_spec(module_name)
+            if spec:
+                results[module_name] = {"status": "Found", "origin": spec.origin}
             else:
                 results[module_name] = {
                     "status": "Not Found",
@@ -119,6 +143,7 @@ class SystemDiagnostics:
     def get_math_module_check(self):
         """Checks the functionality and C-acceleration of the 'math' module."""
         try:
+            import math  # pylint: disable=import-outside-toplevel
             math.sqrt(16)
             return {
                 "status": "OK",
@@ -131,7 +156,10 @@ class SystemDiagnostics:
 
     def get_openssl_info(self):
         """Gathers OpenSSL & SSL Module Information."""
-        default_paths = ssl.get_default_verify_paths()
+        import ssl  # pylint: disable=import-outside-toplevel
+
+        # A named tuple; its dict form gives defaults for fields this OpenSSL build lacks.
+        default_paths = ssl.get_default_verify_paths()._asdict()
         return {
             "openssl_version": ssl.OPENSSL_VERSION,
             "openssl_version_number": ssl.OPENSSL_VERSION_NUMBER,
@@ -140,17 +168,18 @@ class SystemDiagnostics:
             "protocol_tls_client": ssl.PROTOCOL_TLS_CLIENT,
             "protocol_tls_server": ssl.PROTOCOL_TLS_SERVER,
             "default_ca_info": {
-                "ca_file": default_paths.cafile,
-                "ca_path": default_paths.capath,
-                "ssl_cert_file": getattr(default_paths, 'ssl_cert_file', 'N/A'),
-                "ssl_cert_dir": getattr(default_paths, 'ssl_cert_dir', 'N/A'),
-                "ssl_key_file": getattr(default_paths, 'ssl_key_file', 'N/A')
+                "ca_file": default_paths['cafile'],
+                "ca_path": default_paths['capath'],
+                "ssl_cert_file": default_paths.get('ssl_cert_file', 'N/A'),
+                "ssl_cert_dir": default_paths.get('ssl_cert_dir', 'N/A'),
+                "ssl_key_file": default_paths.get('ssl_key_file', 'N/A')
             }
         }
 
     def get_tls13_capability_check(self):
         """Performs TLS 1.3 Capability Check."""
         try:
+            import ssl  # pylint: disable=import-outside-toplevel
             context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
             context.minimum_version = ssl.TLSVersion.TLSv1_3
             return {"status": "OK", "details": "SSLContext created with minimum TLS 1.3 version."}
@@ -160,6 +189,7 @@ class SystemDiagnostics:
     def get_hashlib_check(self):
         """Performs Hashlib Functionality Check."""
         try:
+            import hashlib  # pylint: disable=import-outside-toplevel
             hashlib.blake2b()
             return {"status": "OK", "details": "hashlib.blake2b() initialization successful."}
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -167,6 +197,11 @@ class SystemDiagnostics:
 
     def get_system_resource_limits(self):
         """Gathers System Resource Limits (Unix-like only)."""
+        try:
+            import resource  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            resource = None  # Will be None on Windows (Unix-like systems only)
+
         if not resource:
             return {
                 "status": "Not Available",
@@ -174,19 +209,14 @@ class SystemDiagnostics:
             }
 
         limits = {}
-        limit_names = {
-            'RLIMIT_NOFILE': 'max_open_files',
-            'RLIMIT_AS': 'address_space_gb',
-            'RLIMIT_NPROC': 'max_processes'
-        }
-        for name, key in limit_names.items():
+        for name, key in _RLIMIT_NAMES:
             try:
                 rlimit_id = getattr(resource, name)
                 soft, hard = resource.getrlimit(rlimit_id)  # type: ignore
 
                 if 'gb' in key:
-                    soft = f"{soft / (1024**3):.2f}" if soft != -1 else "Unlimited"
-                    hard = f"{hard / (1024**3):.2f}" if hard != -1 else "Unlimited"
+                    soft = f"{soft / _GB:.2f}" if soft != -1 else "Unlimited"
+                    hard = f"{hard / _GB:.2f}" if hard != -1 else "Unlimited"
 
                 limits[key] = {"soft": soft, "hard": hard}
             except (AttributeError, ValueError):
@@ -196,170 +226,254 @@ class SystemDiagnostics:
 # ----------------------------------------
 # Presentation Functions
 # ----------------------------------------
-def print_text_report(results):  # pylint: disable=too-many-branches,too-many-statements
+def print_text_report(results):  # pylint: disable=too-many-branches,too-many-statements,too-many-locals
     """
     Prints the diagnostic results in a human-readable text format,
     matching the original script's output.
+
+    The report is buffered and written with a single call; errors go to stderr.
     """
+    lines = []
+
+    def print_error(message):
+        # Write out the buffered report first, so that the error keeps its place on a terminal.
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+        sys.stdout.flush()
+        print(message, file=sys.stderr)
+
     if 'env' in results:
         data = results['env']
-        print("\n----- Python Interpreter & Environment -----")
-        print(f"Python executable: {data['executable']}")
-        print(f"Python version: {data['version']}")
-        print(f"Python sitelib path (purelib): {data['sitelib_path']}")
-        print(f"Python sitearch path (platlib): {data['sitearch_path']}")
-        print(f"Python system platform: {data['platform']}")
-        print(f"Python default encoding: {data['default_encoding']}")
-        print(f"Python filesystem encoding: {data['filesystem_encoding']}")
-        print("\nPython interpreter flags:")
-        for key, value in data['interpreter_flags'].items():
-            print(f"  - {key}: {value}")
+        lines.append("\n----- Python Interpreter & Environment -----")
+        lines.append(f"Python executable: {data['executable']}")
+        lines.append(f"Python version: {data['version']}")
+        lines.append(f"Python sitelib path (purelib): {data['sitelib_path']}")
+        lines.append(f"Python sitearch path (platlib): {data['sitearch_path']}")
+        lines.append(f"Python system platform: {data['platform']}")
+        lines.append(f"Python default encoding: {data['default_encoding']}")
+        lines.append(f"Python filesystem encoding: {data['filesystem_encoding']}")
+        lines.append("\nPython interpreter flags:")
+        lines.extend(f"  - {key}: {value}" for key, value in data['interpreter_flags'].items())
 
     if 'build' in results:
         data = results['build']
-        print("\n----- Python Build-Time Configuration -----")
-        print(f"Compiler used (CC): {data['compiler']}")
-        print(f"CFlags (CFLAGS): {data['cflags']}")
-        print(f"LdFlags (LDFLAGS): {data['ldflags']}")
-        print(f"Optimization Level (OPT): {data['optimization_level']}")
-        print(f"Python Debug Build (PYDEBUG): {data['debug_build']}")
-        print(f"PyMALLOC enabled (WITH_PYMALLOC): {data['pymalloc_enabled']}")
-        print(f"Built as Shared Library (PY_ENABLE_SHARED): {data['shared_library']}")
+        lines.append("\n----- Python Build-Time Configuration -----")
+        lines.append(f"Compiler used (CC): {data['compiler']}")
+        lines.append(f"CFlags (CFLAGS): {data['cflags']}")
+        lines.append(f"LdFlags (LDFLAGS): {data['ldflags']}")
+        lines.append(f"Optimization Level (OPT): {data['optimization_level']}")
+        lines.append(f"Python Debug Build (PYDEBUG): {data['debug_build']}")
+        lines.append(f"PyMALLOC enabled (WITH_PYMALLOC): {data['pymalloc_enabled']}")
+        lines.append(f"Built as Shared Library (PY_ENABLE_SHARED): {data['shared_library']}")
 
     if 'paths' in results:
         data = results['paths']
-        print("\n----- Python Module Search Path (sys.path) -----")
-        for i, path in enumerate(data['paths']):
-            print(f"  {i}: {path}")
+        lines.append("\n----- Python Module Search Path (sys.path) -----")
+        lines.extend(f"  {i}: {path}" for i, path in enumerate(data['paths']))
 
     if 'stdlib' in results:
         data = results['stdlib']
-        print("\n----- Key Standard Library C-Extensions -----")
+        lines.append("\n----- Key Standard Library C-Extensions -----")
         for name, info in data.items():
             if info['status'] == 'Found':
-                print(f"  - {name}: Found (from {info['origin']})")
+                lines.append(f"  - {name}: Found (from {info['origin']})")
             else:
-                print(f"  - {name}: NOT Found (may indicate missing development libraries "
-                      f"during build)", file=sys.stderr)
+                print_error(f"  - {name}: NOT Found (may indicate missing development "
+                            f"libraries during build)")
 
     if 'math' in results:
         data = results['math']
-        print("\n----- Math Module C-Functionality Check -----")
+        lines.append("\n----- Math Module C-Functionality Check -----")
         if data['status'] == 'OK':
-            print("math module successfully imported.")
-            print("math.sqrt(16) worked: 4.0")
-            print("This indicates math module's core (C) functions are accessible.")
-            print(f"math.__file__: {data['file']}")
-            print(f"math.__loader__: {data['loader']}")
+            lines.append("math module successfully imported.")
+            lines.append("math.sqrt(16) worked: 4.0")
+            lines.append("This indicates math module's core (C) functions are accessible.")
+            lines.append(f"math.__file__: {data['file']}")
+            lines.append(f"math.__loader__: {data['loader']}")
         else:
-            print(f"Error: {data['details']}", file=sys.stderr)
+            print_error(f"Error: {data['details']}")
 
     if 'ssl' in results:
         data = results['ssl']
-        print("\n----- OpenSSL & SSL Module Information -----")
-        print(f"OpenSSL version Python is using: {data['openssl_version']}")
-        print(f"OpenSSL version number: {data['openssl_version_number']}")
-        print(f"OpenSSL built on: {data['openssl_built_on']}")
-        print(f"OpenSSL TLS v1.2 protocol constant: {data['protocol_tlsv1_2']}")
-        print(f"Highest available client-side TLS protocol (PROTOCOL_TLS_CLIENT): "
-              f"{data['protocol_tls_client']}")
-        print(f"Highest available server-side TLS protocol (PROTOCOL_TLS_SERVER): "
-              f"{data['protocol_tls_server']}")
-        print("\nDefault CA certificate paths (ssl.get_default_verify_paths()):")
-        for key, value in data['default_ca_info'].items():
-            print(f"  - {key.replace('_', ' ').title()}: {value}")
+        lines.append("\n----- OpenSSL & SSL Module Information -----")
+        lines.append(f"OpenSSL version Python is using: {data['openssl_version']}")
+        lines.append(f"OpenSSL version number: {data['openssl_version_number']}")
+        lines.append(f"OpenSSL built on: {data['openssl_built_on']}")
+        lines.append(f"OpenSSL TLS v1.2 protocol constant: {data['protocol_tlsv1_2']}")
+        lines.append(f"Highest available client-side TLS protocol (PROTOCOL_TLS_CLIENT): "
+                     f"{data['protocol_tls_client']}")
+        lines.append(f"Highest available server-side TLS protocol (PROTOCOL_TLS_SERVER): "
+                     f"{data['protocol_tls_server']}")
+        lines.append("\nDefault CA certificate paths (ssl.get_default_verify_paths()):")
+        lines.extend(f"  - {key.replace('_', ' ').title()}: {value}"
+                     for key, value in data['default_ca_info'].items())
 
     if 'tls13' in results:
         data = results['tls13']
-        print("\n----- TLS 1.3 Capability Check -----")
+        lines.append("\n----- TLS 1.3 Capability Check -----")
         if data['status'] == 'OK':
-            print(f"TLSVersion.TLSv1_3 constant: {ssl.TLSVersion.TLSv1_3}")
-            print("SSLContext successfully created with minimum TLS 1.3 version.")
-            print("This confirms active TLS 1.3 support through OpenSSL.")
+            # Already imported by the successful check; this is only a lookup.
+            import ssl  # pylint: disable=import-outside-toplevel
+            lines.append(f"TLSVersion.TLSv1_3 constant: {ssl.TLSVersion.TLSv1_3}")
+            lines.append("SSLContext successfully created with minimum TLS 1.3 version.")
+            lines.append("This confirms active TLS 1.3 support through OpenSSL.")
         else:
-            print(f"Error: {data['details']}", file=sys.stderr)
+            print_error(f"Error: {data['details']}")
 
     if 'hashlib' in results:
         data = results['hashlib']
-        print("\n----- Hashlib Functionality Check -----")
+        lines.append("\n----- Hashlib Functionality Check -----")
         if data['status'] == 'OK':
-            print("hashlib.blake2b() initialization worked successfully.")
-            print("This confirms OpenSSL's cryptographic hash algorithms are accessible.")
+            lines.append("hashlib.blake2b() initialization worked successfully.")
+            lines.append("This confirms OpenSSL's cryptographic hash algorithms are accessible.")
         else:
-            print(f"Error: {data['details']}", file=sys.stderr)
+            print_error(f"Error: {data['details']}")
 
     if 'rlimits' in results:
         data = results['rlimits']
-        print("\n----- System Resource Limits -----")
+        lines.append("\n----- System Resource Limits -----")
         if data['status'] == 'OK':
-            print(f"Max Open Files (RLIMIT_NOFILE): "
-                  f"{data['limits']['max_open_files']['soft']} / "
-                  f"{data['limits']['max_open_files']['hard']}")
+            lines.append(f"Max Open Files (RLIMIT_NOFILE): "
+                         f"{data['limits']['max_open_files']['soft']} / "
+                         f"{data['limits']['max_open_files']['hard']}")
             addr_space = data['limits']['address_space_gb']
             soft, hard = addr_space['soft'], addr_space['hard']
-            soft_gb = (f"{soft / (1024**3):.2f} GB" if isinstance(soft, (int, float)) and soft != -1
+            soft_gb = (f"{soft / _GB:.2f} GB" if isinstance(soft, (int, float)) and soft != -1
                        else "Unlimited")
-            hard_gb = (f"{hard / (1024**3):.2f} GB" if isinstance(hard, (int, float)) and hard != -1
+            hard_gb = (f"{hard / _GB:.2f} GB" if isinstance(hard, (int, float)) and hard != -1
                        else "Unlimited")
-            print(f"Address Space (RLIMIT_AS): {soft_gb} / {hard_gb}")
+            lines.append(f"Address Space (RLIMIT_AS): {soft_gb} / {hard_gb}")
             if 'max_processes' in data['limits']:
                 proc = data['limits']['max_processes']
-                print(f"Max Processes (RLIMIT_NPROC): {proc['soft']} / {proc['hard']}")
+                lines.append(f"Max Processes (RLIMIT_NPROC): {proc['soft']} / {proc['hard']}")
         else:
-            print(data['details'])
+            lines.append(data['details'])
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 
 def print_json_report(results):
-    """Prints the diagnostic results as a JSON object."""
-    print(json.dumps(results, indent=2))
+    """
+    Prints the diagnostic results as a JSON object with a two-space indent.
+
+    The shared helper (with `json` and the optional 'orjson' library behind it) is, like the
+    check modules, only imported when this output is requested.
+    """
+    from python_json_utils import print_json  # pylint: disable=import-outside-toplevel
+    print_json(results, indent=2)
 
 # ----------------------------------------
 # Main Execution Logic
 # ----------------------------------------
-def main():
+# Environment variables that must be unset for the diagnostics to describe the interpreter's
+# own configuration; a PYTHONPATH also adds entries that every module lookup has to search.
+_UNSET_ENV_VARS = ('PYTHONPATH', 'PYTHONHOME', 'PYTHON', 'PYTHON_PLATFORM')
+
+# Set in the environment of the re-executed process, so that it never re-executes again.
+_REEXEC_MARKER = 'PYTHON_SYSDIAGS_REEXECUTED'
+
+def sanitized_environment(environ):
     """
-    Parses command-line arguments and orchestrates the execution of the
-    selected diagnostic functions.
+    Decides whether the script must re-execute itself, and with which environment.
+
+    Args:
+        environ (Mapping[str, str]): The current environment (e.g. `os.environ`).
+
+    Returns:
+        dict: A copy of `environ` without the variables listed in _UNSET_ENV_VARS and with
+              _REEXEC_MARKER set, or None if none of them is set or if this process is
+              already the re-executed one.
     """
-    if sys.version_info < (3, 10):
-        print("Error: This script requires Python 3.10 or newer.", file=sys.stderr)
-        sys.exit(1)
+    if _REEXEC_MARKER in environ or not any(name in environ for name in _UNSET_ENV_VARS):
+        return None
+    env = {key: value for key, value in environ.items() if key not in _UNSET_ENV_VARS}
+    env[_REEXEC_MARKER] = '1'
+    return env
+
+def reexec_without_python_env():
+    """
+    Replaces the current process with a fresh run of the same command line, without the
+    variables listed in _UNSET_ENV_VARS. Returns normally if none of them is set, or if the
+    process was already re-executed once. Only meant for script execution.
+    """
+    env = sanitized_environment(os.environ)
+    if env is None:
+        return
+    found = [name for name in _UNSET_ENV_VARS if name in os.environ]
+    print(f"Note: re-running without {', '.join(found)}.", file=sys.stderr)
+    sys.stderr.flush()
+    # `sys.orig_argv` (Python 3.10+) also keeps the interpreter options (e.g. -X).
+    argv = list(sys.orig_argv)
+    if sys.flags.utf8_mode:
+        # UTF-8 mode may come from the C locale, which this process has already coerced to
+        # C.UTF-8 in the environment: carry it over explicitly.
+        argv[1:1] = ['-X', 'utf8']
+    os.execve(sys.executable, argv, env)
+
+# Argument definition using a dispatch table pattern: each section's command-line flag
+# mapped to the SystemDiagnostics method (an unbound function) that gathers it, in report order.
+_DISPATCH_MAP = {
+    'env': SystemDiagnostics.get_python_env_details,
+    'build': SystemDiagnostics.get_python_build_config,
+    'paths': SystemDiagnostics.get_module_search_paths,
+    'stdlib': SystemDiagnostics.get_stdlib_c_extensions_check,
+    'math': SystemDiagnostics.get_math_module_check,
+    'ssl': SystemDiagnostics.get_openssl_info,
+    'tls13': SystemDiagnostics.get_tls13_capability_check,
+    'hashlib': SystemDiagnostics.get_hashlib_check,
+    'rlimits': SystemDiagnostics.get_system_resource_limits,
+}
+
+def build_parser():
+    """
+    Builds the command-line argument parser.
+
+    Only called by `main`, so that importing this file as a library does not construct it
+    (nor import argparse).
+
+    Returns:
+        argparse.ArgumentParser: The parser, with one flag per diagnostic section.
+    """
+    import argparse  # pylint: disable=import-outside-toplevel
 
     parser = argparse.ArgumentParser(
         description="A comprehensive Python script to verify the Python interpreter's environment.",
         formatter_class=argparse.RawTextHelpFormatter
     )
 
-    # Argument definition using a dispatch table pattern
-    dispatch_map = {
-        'env': 'get_python_env_details',
-        'build': 'get_python_build_config',
-        'paths': 'get_module_search_paths',
-        'stdlib': 'get_stdlib_c_extensions_check',
-        'math': 'get_math_module_check',
-        'ssl': 'get_openssl_info',
-        'tls13': 'get_tls13_capability_check',
-        'hashlib': 'get_hashlib_check',
-        'rlimits': 'get_system_resource_limits',
-    }
-
     parser.add_argument('--json', action='store_true', help='Output results in JSON format.')
     parser.add_argument('--all', action='store_true', help='Display all sections (default).')
-    for arg, method in dispatch_map.items():
+    for arg in _DISPATCH_MAP:
         parser.add_argument(f'--{arg}', action='store_true',
                             help=f"Display {arg.replace('_', ' ')} info.")
+    return parser
+
+def main(argv=None):
+    """
+    Parses command-line arguments and orchestrates the execution of the
+    selected diagnostic functions.
+
+    Args:
+        argv (list): The arguments to parse; defaults to `sys.argv[1:]`.
+    """
+    if sys.version_info < (3, 10):
+        print("Error: This script requires Python 3.10 or newer.", file=sys.stderr)
+        sys.exit(1)
 
-    args = parser.parse_args()
+    args = build_parser().parse_args(argv)
+    selected = vars(args)
 
     diagnostics = SystemDiagnostics()
     results = {}
 
     # Determine which checks to run
-    run_all = not any(getattr(args, arg) for arg in dispatch_map) or args.all
+    run_all = not any(selected[arg] for arg in _DISPATCH_MAP) or args.all
 
-    for arg, method_name in dispatch_map.items():
-        if run_all or getattr(args, arg):
-            method = getattr(diagnostics, method_name)
-            results[arg] = method()
+    for arg, method in _DISPATCH_MAP.items():
+        if run_all or selected[arg]:
+            results[arg] = method(diagnostics)
 
     if args.json:
         print_json_report(results)
@@ -367,4 +481,7 @@ def main():
         print_text_report(results)
 
 if __name__ == "__main__":
+    # Only as a script: a library caller of main() must never have its process replaced.
+    if sys.version_info >= (3, 10):
+        reexec_without_python_env()
     main()
@@ -0,0 +1,86 @@
+"""
+Tests for the JSON output helpers of python_json_utils.py.
+
+Run from the python_systools directory with: python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_json_utils  # pylint: disable=wrong-import-position,import-error
+
+SAMPLE = [{"name": "café", "version": "1.0", "latest_version": "2.0"}]
+
+HAS_ORJSON = python_json_utils.orjson is not None
+
+
+def _capture_bytes(function, *args, **kwargs):
+    """Runs function with a byte-backed stdout and returns what it wrote, decoded."""
+    buffer = io.BytesIO()
+    stdout = io.TextIOWrapper(buffer, encoding="utf-8")
+    with contextlib.redirect_stdout(stdout):
+        function(*args, **kwargs)
+    stdout.flush()
+    return buffer.getvalue().decode("utf-8")
+
+
+class PrintJsonTest(unittest.TestCase):
+    """Pins the output shape of print_json() for both serializers."""
+
+    def test_stdlib_fallback_layout(self):
+        """Without orjson, the output keeps a four-space indent and ASCII escapes."""
+        with mock.patch.object(python_json_utils, 'orjson', None), \
+                contextlib.redirect_stdout(io.StringIO()) as output:
+            python_json_utils.print_json(SAMPLE)
+        self.assertEqual(output.getvalue(), json.dumps(SAMPLE, indent=4) + "\n")
+        self.assertIn('\n    {\n        "name": "caf\\u00e9"', output.getvalue())
+
+    def test_stdlib_fallback_indent(self):
+        """The fallback indent can be chosen by the calling tool."""
+        with mock.patch.object(python_json_utils, 'orjson', None), \
+                contextlib.redirect_stdout(io.StringIO()) as output:
+            python_json_utils.print_json(SAMPLE, indent=2)
+        self.assertEqual(output.getvalue(), json.dumps(SAMPLE, indent=2) + "\n")
+
+    def test_empty_list(self):
+        """An empty result is printed as a bare empty list."""
+        with mock.patch.object(python_json_utils, 'orjson', None), \
+                contextlib.redirect_stdout(io.StringIO()) as output:
+            python_json_utils.print_json([])
+        self.assertEqual(output.getvalue(), "[]\n")
+
+    @unittest.skipIf(not HAS_ORJSON, "orjson is not installed")
+    def test_orjson_layout(self):
+        """With orjson, the output has a two-space indent and the same data."""
+        text = _capture_bytes(python_json_utils.print_json, SAMPLE)
+        self.assertEqual(json.loads(text), SAMPLE)
+        self.assertIn('\n  {\n    "name": "café"', text)
+
+
+class CompactJsonTest(unittest.TestCase):
+    """Pins the compact (NDJSON) layout of print_json(indent=None) for both serializers."""
+
+    def test_stdlib_fallback_layout(self):
+        """Without orjson, each line is compact, with ASCII escapes."""
+        with mock.patch.object(python_json_utils, 'orjson', None), \
+                contextlib.redirect_stdout(io.StringIO()) as output:
+            python_json_utils.print_json(SAMPLE[0], indent=None)
+        self.assertEqual(output.getvalue(),
+                         '{"name":"caf\\u00e9","version":"1.0","latest_version":"2.0"}\n')
+
+    @unittest.skipIf(not HAS_ORJSON, "orjson is not installed")
+    def test_orjson_layout(self):
+        """With orjson, the separators are the same as with the fallback."""
+        text = _capture_bytes(python_json_utils.print_json, SAMPLE[0], indent=None)
+        self.assertEqual(text, '{"name":"café","version":"1.0","latest_version":"2.0"}\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for the PyPI Simple API version selection of python_pkg_utils.py.
+
+Run from the python_systools directory with: python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_pkg_utils  # pylint: disable=wrong-import-position,import-error
+
+
+def _simple_response(versions, files):
+    """Builds a stand-in for a PEP 691 JSON Simple API response."""
+    response = mock.Mock()
+    response.headers = {'Content-Type': python_pkg_utils.PYPI_SIMPLE_CONTENT_TYPE}
+    response.json.return_value = {'versions': versions, 'files': files}
+    return response
+
+
+def _file(filename, yanked=False):
+    """Builds a Simple API file entry."""
+    return {'filename': filename, 'yanked': yanked}
+
+
+@unittest.skipUnless(python_pkg_utils.HAS_PACKAGING, "packaging is not installed")
+class LatestFromSimpleIndexTest(unittest.TestCase):
+    """Tests for _latest_from_simple_index()."""
+
+    def latest(self, versions, files):
+        """Returns the version picked from a Simple API response."""
+        return python_pkg_utils._latest_from_simple_index(  # pylint: disable=protected-access
+            _simple_response(versions, files))
+
+    def test_highest_final_release(self):
+        """The highest final release wins over a newer pre-release."""
+        self.assertEqual(self.latest(['1.0', '1.1', '2.0rc1'], [
+            _file('demo-1.0.tar.gz'), _file('demo-1.1.tar.gz'), _file('demo-2.0rc1.tar.gz')]),
+            '1.1')
+
+    def test_yanked_release_is_skipped(self):
+        """A release whose files are all yanked is never reported as the latest one."""
+        self.assertEqual(self.latest(['1.0', '1.1'], [
+            _file('demo-1.0.tar.gz'),
+            _file('demo-1.1.tar.gz', yanked='broken'),
+            _file('demo-1.1-py3-none-any.whl', yanked=True)]), '1.0')
+
+    def test_partially_yanked_release_is_kept(self):
+        """A release with one file still available is not yanked."""
+        self.assertEqual(self.latest(['1.0', '1.1'], [
+            _file('demo-1.0.tar.gz'),
+            _file('demo-1.1.tar.gz', yanked='broken sdist'),
+            _file('demo-1.1-py3-none-any.whl')]), '1.1')
+
+    def test_every_release_yanked(self):
+        """Without any release left, the caller falls back to the JSON API."""
+        self.assertIsNone(self.latest(['1.0'], [_file('demo-1.0.tar.gz', yanked=True)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
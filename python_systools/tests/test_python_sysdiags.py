@@ -0,0 +1,63 @@
+"""
+Tests for the re-execution decision of python_sysdiags.py.
+
+Run from the python_systools directory with: python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import python_sysdiags  # pylint: disable=wrong-import-position,import-error
+
+SCRIPT = python_sysdiags.__file__
+
+
+class SanitizedEnvironmentTest(unittest.TestCase):
+    """Tests for sanitized_environment()."""
+
+    def test_clean_environment_is_not_reexecuted(self):
+        """No re-execution when none of the variables is set."""
+        self.assertIsNone(python_sysdiags.sanitized_environment({'PATH': '/usr/bin'}))
+
+    def test_python_variables_are_removed(self):
+        """The variables are removed, other ones are kept, and the marker is set."""
+        env = python_sysdiags.sanitized_environment(
+            {'PATH': '/usr/bin', 'PYTHONPATH': '/tmp/a', 'PYTHONHOME': '/tmp/b'})
+        self.assertEqual(env, {'PATH': '/usr/bin', python_sysdiags._REEXEC_MARKER: '1'})  # pylint: disable=protected-access
+
+    def test_reexecuted_process_does_not_loop(self):
+        """A process that was already re-executed never re-executes again."""
+        self.assertIsNone(python_sysdiags.sanitized_environment(
+            {'PYTHONPATH': '/tmp/a', python_sysdiags._REEXEC_MARKER: '1'}))  # pylint: disable=protected-access
+
+
+class ReexecDecisionTest(unittest.TestCase):
+    """Tests that only script execution re-executes."""
+
+    def test_main_never_replaces_the_caller_process(self):
+        """A library call of main() runs in-process even with PYTHONPATH set."""
+        with mock.patch.dict(os.environ, {'PYTHONPATH': '/tmp/a'}), \
+                mock.patch.object(os, 'execve', side_effect=AssertionError("execve called")), \
+                contextlib.redirect_stdout(io.StringIO()) as output:
+            python_sysdiags.main(['--paths'])
+        self.assertIn("Module Search Path", output.getvalue())
+
+    def test_script_reexecutes_once_without_pythonpath(self):
+        """Run as a script, the process re-executes once, without PYTHONPATH."""
+        env = dict(os.environ, PYTHONPATH='/tmp/python_sysdiags_test_path')
+        env.pop(python_sysdiags._REEXEC_MARKER, None)  # pylint: disable=protected-access
+        result = subprocess.run([sys.executable, SCRIPT, '--paths'], env=env,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stderr.count("re-running without PYTHONPATH"), 1)
+        self.assertNotIn('/tmp/python_sysdiags_test_path', result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()